@@ -24,7 +24,6 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, EntityCategory
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -51,21 +50,21 @@ async def async_setup_entry(
         OneControlDataHealthy(coordinator, address),
     ])
 
-    discovered_gen_quiet: set[str] = set()
+    discovered_gen_quiet: set[tuple[int, int]] = set()
 
     @callback
-    def _on_event(event: Any) -> None:
-        if isinstance(event, GeneratorStatus):
-            key = f"{event.table_id:02x}:{event.device_id:02x}"
-            if key not in discovered_gen_quiet:
-                discovered_gen_quiet.add(key)
-                async_add_entities(
-                    [OneControlGeneratorQuietHours(coordinator, address, event.table_id, event.device_id)]
-                )
-
-    coordinator.register_event_callback(_on_event)
-
-    for key, gen in coordinator.generators.items():
+    def _on_generator(event: GeneratorStatus) -> None:
+        key = (event.table_id, event.device_id)
+        if key not in discovered_gen_quiet:
+            discovered_gen_quiet.add(key)
+            async_add_entities(
+                [OneControlGeneratorQuietHours(coordinator, address, event.table_id, event.device_id)]
+            )
+
+    entry.async_on_unload(coordinator.register_event_callback(_on_generator, GeneratorStatus))
+
+    for gen in coordinator.generators.values():
+        key = (gen.table_id, gen.device_id)
         if key not in discovered_gen_quiet:
             discovered_gen_quiet.add(key)
             async_add_entities(
@@ -85,15 +84,9 @@ class OneControlGatewayConnectivity(
 
     def __init__(self, coordinator: OneControlCoordinator, address: str) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_gateway_connected"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -112,15 +105,9 @@ class OneControlGatewayAuthenticated(
 
     def __init__(self, coordinator: OneControlCoordinator, address: str) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_gateway_authenticated"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -145,15 +132,9 @@ class OneControlInMotionLockout(
 
     def __init__(self, coordinator: OneControlCoordinator, address: str) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_in_motion_lockout"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
@@ -196,15 +177,9 @@ class OneControlDataHealthy(
 
     def __init__(self, coordinator: OneControlCoordinator, address: str) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_data_healthy"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -252,16 +227,12 @@ class OneControlGeneratorQuietHours(
         self._table_id = table_id
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_gen_quiet_{device_id:02x}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
+        self._attr_device_info = coordinator.device_info
+        self._unsub = coordinator.register_device_callback(
+            GeneratorStatus, table_id, device_id, self._on_event
         )
-        self._unsub = coordinator.register_event_callback(self._on_event)
 
     @property
     def name(self) -> str:
@@ -283,10 +254,5 @@ class OneControlGeneratorQuietHours(
         self._unsub()
 
     @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, GeneratorStatus)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
+    def _on_event(self, _event: Any) -> None:
+        self.async_write_ha_state()
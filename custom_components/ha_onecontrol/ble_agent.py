@@ -276,6 +276,14 @@ class PinAgentContext:
                 _LOGGER.debug("PIN agent unregistered")
             except Exception as exc:
                 _LOGGER.debug("Agent cleanup error: %s", exc)
+        self.close()
+
+    def close(self) -> None:
+        """Disconnect D-Bus without unregistering the agent.
+
+        Sufficient on its own when no agent was registered; otherwise use
+        cleanup(), which needs a D-Bus round-trip first.
+        """
         if self.bus:
             self.bus.disconnect()
             self.bus = None
@@ -19,7 +19,6 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -60,15 +59,9 @@ class OneControlClearLockoutButton(
 
     def __init__(self, coordinator: OneControlCoordinator, address: str) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_clear_lockout"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
@@ -103,15 +96,9 @@ class OneControlRefreshMetadataButton(
 
     def __init__(self, coordinator: OneControlCoordinator, address: str) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_refresh_metadata"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
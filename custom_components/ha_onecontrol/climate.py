@@ -8,10 +8,12 @@ Reference: INTERNALS.md § HVAC Command
 
 from __future__ import annotations
 
-import asyncio
+from dataclasses import replace
+from datetime import datetime
 import logging
 from typing import Any
 
+from bleak.exc import BleakError
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
@@ -20,15 +22,16 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, UnitOfTemperature
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
     HVAC_CAP_GAS,
     HVAC_CAP_HEAT_PUMP,
+    HVAC_CAP_PRESET_MASK,
     HVAC_FAN_AUTO,
     HVAC_FAN_HIGH,
     HVAC_FAN_LOW,
@@ -61,6 +64,31 @@ _HA_TO_OC_MODE: dict[HVACMode, int] = {v: k for k, v in _OC_TO_HA_MODE.items()}
 _OC_TO_HA_FAN = {0: "auto", 1: "high", 2: "low"}
 _HA_TO_OC_FAN = {"auto": HVAC_FAN_AUTO, "high": HVAC_FAN_HIGH, "low": HVAC_FAN_LOW}
 
+# zone_status low nibble (active status) → HA HVACAction
+_HVAC_ACTION_TABLE: tuple[HVACAction, ...] = (
+    HVACAction.OFF,
+    HVACAction.IDLE,
+    HVACAction.COOLING,
+    HVACAction.HEATING,  # heat pump heating
+    HVACAction.HEATING,  # electric heat
+    HVACAction.HEATING,  # gas furnace
+    HVACAction.HEATING,  # gas override
+    HVACAction.IDLE,     # dead time
+    HVACAction.IDLE,     # load shedding
+)
+
+# heat_mode (3 bits) → HvacZone field shown as the single target temperature.
+# Off and heat_cool have no single setpoint; every other mode shows the
+# cooling setpoint, as before.
+_TARGET_PICK: tuple[str | None, ...] = (
+    None, "low_trip_f", "high_trip_f", None,
+    "high_trip_f", "high_trip_f", "high_trip_f", "high_trip_f",
+)
+
+# Bound lookups used by hot state properties
+_OC_TO_HA_MODE_GET = _OC_TO_HA_MODE.get
+_OC_TO_HA_FAN_GET = _OC_TO_HA_FAN.get
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -71,28 +99,45 @@ async def async_setup_entry(
     coordinator: OneControlCoordinator = hass.data[DOMAIN][entry.entry_id]
     address = entry.data[CONF_ADDRESS]
 
-    discovered: set[str] = set()
+    # Keyed by packed (table_id << 8) | device_id — cheaper than formatting
+    # the coordinator's "tt:dd" string for every routed frame.
+    entities: dict[int, OneControlClimate] = {}
+
+    def _track(key: int, entity: OneControlClimate) -> None:
+        entities[key] = entity
+
+        @callback
+        def _untrack() -> None:
+            # Stop routing zone updates to the entity once it is removed
+            if entities.get(key) is entity:
+                del entities[key]
+
+        entity.async_on_remove(_untrack)
 
     @callback
-    def _on_event(event: Any) -> None:
-        items = event if isinstance(event, list) else [event]
-        for item in items:
-            if isinstance(item, HvacZone):
-                key = f"{item.table_id:02x}:{item.device_id:02x}"
-                if key not in discovered:
-                    discovered.add(key)
-                    async_add_entities(
-                        [OneControlClimate(coordinator, address, item.table_id, item.device_id)]
-                    )
-
-    coordinator.register_event_callback(_on_event)
-
-    for key, zone in coordinator.hvac_zones.items():
-        if key not in discovered:
-            discovered.add(key)
-            async_add_entities(
-                [OneControlClimate(coordinator, address, zone.table_id, zone.device_id)]
-            )
+    def _on_zone(zone: HvacZone) -> None:
+        key = (zone.table_id << 8) | zone.device_id
+        entity = entities.get(key)
+        if entity is not None:
+            entity.async_handle_zone_update(zone)
+            return
+        entity = OneControlClimate(coordinator, address, zone.table_id, zone.device_id)
+        _track(key, entity)
+        async_add_entities([entity])
+
+    entry.async_on_unload(coordinator.register_event_callback(_on_zone, HvacZone))
+
+    # Zones seen before the platform loaded: claim their keys first, then
+    # add them in one batch.
+    existing = [
+        OneControlClimate(coordinator, address, zone.table_id, zone.device_id)
+        for zone in list(coordinator.hvac_zones.values())
+        if (zone.table_id << 8) | zone.device_id not in entities
+    ]
+    for entity in existing:
+        _track((entity._table_id << 8) | entity._device_id, entity)
+    if existing:
+        async_add_entities(existing)
 
 
 class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity):
@@ -116,17 +161,21 @@ class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity)
         self._table_id = table_id
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_climate_{device_id:02x}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
-        )
-        self._unsub = coordinator.register_event_callback(self._on_event)
-        self._setpoint_debounce_handle: asyncio.TimerHandle | None = None
+        self._attr_unique_id = f"{coordinator.mac_clean}_climate_{device_id:02x}"
+        self._attr_device_info = coordinator.device_info
+        # Debounced command: HvacZone field overrides awaiting one ActionHvac
+        self._cancel_debounce: CALLBACK_TYPE | None = None
+        self._debounce_deadline: float = 0.0
+        self._pending: dict[str, int] = {}
+        # Last (heat_mode, capability) → features result
+        self._cached_feats: tuple[int, int, ClimateEntityFeature] | None = None
+        self._write_pending = False
+        # Current zone from coordinator.hvac_zones, refreshed on event dispatch
+        self._zone_ref: HvacZone | None = coordinator.hvac_zones.get(self._key)
+        # Last zone the gateway itself reported; restored if a write fails
+        self._reported_zone: HvacZone | None = self._zone_ref
+        # Observed capability bitmask; only changes when an HvacZone arrives
+        self._cap: int = coordinator.observed_hvac_capability.get(self._key, 0)
 
     @property
     def name(self) -> str:
@@ -138,20 +187,26 @@ class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity)
 
     @property
     def _zone(self) -> HvacZone | None:
-        return self.coordinator.hvac_zones.get(self._key)
+        return self._zone_ref
 
     @property
     def supported_features(self) -> ClimateEntityFeature:
         """Dynamic feature set: single vs dual setpoint, preset mode when capable."""
+        zone = self._zone
+        heat_mode = zone.heat_mode if zone is not None else HVAC_MODE_OFF
+        cap = self._cap
+        cached = self._cached_feats
+        if cached is not None and cached[0] == heat_mode and cached[1] == cap:
+            return cached[2]
         features = ClimateEntityFeature.FAN_MODE
-        mode = self.hvac_mode
+        mode = _OC_TO_HA_MODE_GET(heat_mode, HVACMode.OFF)
         if mode == HVACMode.HEAT_COOL:
             features |= ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
         elif mode != HVACMode.OFF:
             features |= ClimateEntityFeature.TARGET_TEMPERATURE
-        cap = self.coordinator.observed_hvac_capability.get(self._key, 0)
-        if cap & (HVAC_CAP_GAS | HVAC_CAP_HEAT_PUMP):
+        if cap & HVAC_CAP_PRESET_MASK:
             features |= ClimateEntityFeature.PRESET_MODE
+        self._cached_feats = (heat_mode, cap, features)
         return features
 
     @property
@@ -159,7 +214,7 @@ class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity)
         zone = self._zone
         if zone is None:
             return HVACMode.OFF
-        return _OC_TO_HA_MODE.get(zone.heat_mode, HVACMode.OFF)
+        return _OC_TO_HA_MODE_GET(zone.heat_mode, HVACMode.OFF)
 
     @property
     def hvac_action(self) -> HVACAction | None:
@@ -167,29 +222,21 @@ class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity)
         if zone is None:
             return None
         active = zone.zone_status & 0x0F
-        return {
-            0: HVACAction.OFF,
-            1: HVACAction.IDLE,
-            2: HVACAction.COOLING,
-            3: HVACAction.HEATING,  # heat pump heating
-            4: HVACAction.HEATING,  # electric heat
-            5: HVACAction.HEATING,  # gas furnace
-            6: HVACAction.HEATING,  # gas override
-            7: HVACAction.IDLE,     # dead time
-            8: HVACAction.IDLE,     # load shedding
-        }.get(active, HVACAction.OFF)
+        if active < len(_HVAC_ACTION_TABLE):
+            return _HVAC_ACTION_TABLE[active]
+        return HVACAction.OFF
 
     @property
     def fan_mode(self) -> str | None:
         zone = self._zone
         if zone is None:
             return None
-        return _OC_TO_HA_FAN.get(zone.fan_mode, "auto")
+        return _OC_TO_HA_FAN_GET(zone.fan_mode, "auto")
 
     @property
     def preset_modes(self) -> list[str] | None:
-        cap = self.coordinator.observed_hvac_capability.get(self._key, 0)
-        if not (cap & (HVAC_CAP_GAS | HVAC_CAP_HEAT_PUMP)):
+        cap = self._cap
+        if not (cap & HVAC_CAP_PRESET_MASK):
             return None
         modes = [HVAC_PRESET_NONE]
         if cap & HVAC_CAP_GAS:
@@ -203,8 +250,8 @@ class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity)
         zone = self._zone
         if zone is None:
             return None
-        cap = self.coordinator.observed_hvac_capability.get(self._key, 0)
-        if not (cap & (HVAC_CAP_GAS | HVAC_CAP_HEAT_PUMP)):
+        cap = self._cap
+        if not (cap & HVAC_CAP_PRESET_MASK):
             return None
         return {0: HVAC_PRESET_GAS, 1: HVAC_PRESET_HEAT_PUMP}.get(
             zone.heat_source, HVAC_PRESET_NONE
@@ -219,9 +266,10 @@ class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity)
     def target_temperature(self) -> float | None:
         """Single setpoint for heat or cool mode; None for heat_cool / off."""
         zone = self._zone
-        if zone is None or zone.heat_mode == 0 or zone.heat_mode == 3:
+        if zone is None:
             return None
-        return float(zone.low_trip_f if zone.heat_mode == 1 else zone.high_trip_f)
+        attr = _TARGET_PICK[zone.heat_mode & 0x07]
+        return float(getattr(zone, attr)) if attr else None
 
     @property
     def target_temperature_low(self) -> float | None:
@@ -255,55 +303,29 @@ class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity)
         if zone is None:
             return
         oc_mode = _HA_TO_OC_MODE.get(hvac_mode, HVAC_MODE_OFF)
-        new_zone = HvacZone(
-            table_id=zone.table_id, device_id=zone.device_id,
-            heat_mode=oc_mode, heat_source=zone.heat_source,
-            fan_mode=zone.fan_mode, low_trip_f=zone.low_trip_f,
-            high_trip_f=zone.high_trip_f, zone_status=zone.zone_status,
-            indoor_temp_f=zone.indoor_temp_f, outdoor_temp_f=zone.outdoor_temp_f,
-            dtc_code=zone.dtc_code,
+        self.coordinator.hvac_zones[self._key] = self._zone_ref = replace(
+            zone, heat_mode=oc_mode
         )
-        self.coordinator.hvac_zones[self._key] = new_zone
-        self.coordinator._hvac_zone_states[self._key] = new_zone
         self.async_write_ha_state()
-        await self.coordinator.async_set_hvac(
-            self._table_id, self._device_id,
-            heat_mode=oc_mode, heat_source=zone.heat_source,
-            fan_mode=zone.fan_mode, low_trip_f=zone.low_trip_f,
-            high_trip_f=zone.high_trip_f,
-            is_setpoint_change=False, is_preset_change=False,
-        )
+        self._queue_change(heat_mode=oc_mode)
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         zone = self._zone
         if zone is None:
             return
         oc_fan = _HA_TO_OC_FAN.get(fan_mode, HVAC_FAN_AUTO)
-        new_zone = HvacZone(
-            table_id=zone.table_id, device_id=zone.device_id,
-            heat_mode=zone.heat_mode, heat_source=zone.heat_source,
-            fan_mode=oc_fan, low_trip_f=zone.low_trip_f,
-            high_trip_f=zone.high_trip_f, zone_status=zone.zone_status,
-            indoor_temp_f=zone.indoor_temp_f, outdoor_temp_f=zone.outdoor_temp_f,
-            dtc_code=zone.dtc_code,
+        self.coordinator.hvac_zones[self._key] = self._zone_ref = replace(
+            zone, fan_mode=oc_fan
         )
-        self.coordinator.hvac_zones[self._key] = new_zone
-        self.coordinator._hvac_zone_states[self._key] = new_zone
         self.async_write_ha_state()
-        await self.coordinator.async_set_hvac(
-            self._table_id, self._device_id,
-            heat_mode=zone.heat_mode, heat_source=zone.heat_source,
-            fan_mode=oc_fan, low_trip_f=zone.low_trip_f,
-            high_trip_f=zone.high_trip_f,
-            is_setpoint_change=False, is_preset_change=False,
-        )
+        self._queue_change(fan_mode=oc_fan)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         zone = self._zone
         if zone is None:
             return
-        low = zone.low_trip_f
-        high = zone.high_trip_f
+        low = self._pending.get("low_trip_f", zone.low_trip_f)
+        high = self._pending.get("high_trip_f", zone.high_trip_f)
 
         if "target_temp_low" in kwargs:
             low = int(kwargs["target_temp_low"])
@@ -316,42 +338,8 @@ class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity)
             else:
                 high = temp
 
-        # Debounce rapid slider changes (250ms, matching Android plugin)
-        if self._setpoint_debounce_handle is not None:
-            self._setpoint_debounce_handle.cancel()
-            self._setpoint_debounce_handle = None
-
-        # Capture values for the closure
-        _low, _high = low, high
-
-        async def _send_setpoint() -> None:
-            self._setpoint_debounce_handle = None
-            current = self._zone
-            if current is None:
-                return
-            new_zone = HvacZone(
-                table_id=current.table_id, device_id=current.device_id,
-                heat_mode=current.heat_mode, heat_source=current.heat_source,
-                fan_mode=current.fan_mode, low_trip_f=_low,
-                high_trip_f=_high, zone_status=current.zone_status,
-                indoor_temp_f=current.indoor_temp_f, outdoor_temp_f=current.outdoor_temp_f,
-                dtc_code=current.dtc_code,
-            )
-            self.coordinator.hvac_zones[self._key] = new_zone
-            self.coordinator._hvac_zone_states[self._key] = new_zone
-            self.async_write_ha_state()
-            await self.coordinator.async_set_hvac(
-                self._table_id, self._device_id,
-                heat_mode=current.heat_mode, heat_source=current.heat_source,
-                fan_mode=current.fan_mode, low_trip_f=_low, high_trip_f=_high,
-                is_setpoint_change=True, is_preset_change=False,
-            )
-
-        loop = asyncio.get_running_loop()
-        self._setpoint_debounce_handle = loop.call_later(
-            HVAC_SETPOINT_DEBOUNCE_S,
-            lambda: self.coordinator.hass.async_create_task(_send_setpoint()),
-        )
+        # Setpoint is applied locally at flush time, not per slider tick
+        self._queue_change(low_trip_f=low, high_trip_f=high)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         zone = self._zone
@@ -361,39 +349,106 @@ class OneControlClimate(CoordinatorEntity[OneControlCoordinator], ClimateEntity)
             HVAC_PRESET_GAS: 0,
             HVAC_PRESET_HEAT_PUMP: 1,
         }.get(preset_mode, zone.heat_source)
-        new_zone = HvacZone(
-            table_id=zone.table_id, device_id=zone.device_id,
-            heat_mode=zone.heat_mode, heat_source=heat_source,
-            fan_mode=zone.fan_mode, low_trip_f=zone.low_trip_f,
-            high_trip_f=zone.high_trip_f, zone_status=zone.zone_status,
-            indoor_temp_f=zone.indoor_temp_f, outdoor_temp_f=zone.outdoor_temp_f,
-            dtc_code=zone.dtc_code,
+        self.coordinator.hvac_zones[self._key] = self._zone_ref = replace(
+            zone, heat_source=heat_source
         )
-        self.coordinator.hvac_zones[self._key] = new_zone
-        self.coordinator._hvac_zone_states[self._key] = new_zone
         self.async_write_ha_state()
-        await self.coordinator.async_set_hvac(
-            self._table_id, self._device_id,
-            heat_mode=zone.heat_mode, heat_source=heat_source,
-            fan_mode=zone.fan_mode, low_trip_f=zone.low_trip_f,
-            high_trip_f=zone.high_trip_f,
-            is_setpoint_change=False, is_preset_change=True,
-        )
+        self._queue_change(heat_source=heat_source)
+
+    def _queue_change(self, **fields: int) -> None:
+        """Merge HvacZone field changes into the pending command.
+
+        Debounces rapid changes (250ms, matching Android plugin) so a slider
+        drag, or a mode + setpoint change made together, goes out as one
+        ActionHvac write.  Each change only pushes the deadline out; the armed
+        timer re-arms itself if it fires early instead of being cancelled.
+        """
+        self._pending.update(fields)
+        self._debounce_deadline = self.hass.loop.time() + HVAC_SETPOINT_DEBOUNCE_S
+        if self._cancel_debounce is None:
+            self._cancel_debounce = async_call_later(
+                self.hass, HVAC_SETPOINT_DEBOUNCE_S, self._maybe_flush
+            )
 
-    async def async_will_remove_from_hass(self) -> None:
-        self._unsub()
-        if self._setpoint_debounce_handle is not None:
-            self._setpoint_debounce_handle.cancel()
-            self._setpoint_debounce_handle = None
+    @callback
+    def _maybe_flush(self, _now: datetime) -> None:
+        """Flush once changes have been quiet for the debounce window."""
+        remaining = self._debounce_deadline - self.hass.loop.time()
+        if remaining > 0:
+            self._cancel_debounce = async_call_later(
+                self.hass, remaining, self._maybe_flush
+            )
+            return
+        self._cancel_debounce = None
+        self._flush_pending()
 
     @callback
-    def _on_event(self, event: Any) -> None:
-        items = event if isinstance(event, list) else [event]
-        for item in items:
-            if (
-                isinstance(item, HvacZone)
-                and item.table_id == self._table_id
-                and item.device_id == self._device_id
-            ):
-                self.async_write_ha_state()
+    def _flush_pending(self) -> None:
+        """Apply merged changes locally and hand one write to the coordinator."""
+        pending, self._pending = self._pending, {}
+        current = self._zone
+        if current is None or not pending:
+            return
+        zone = replace(current, **pending)
+        self.coordinator.hvac_zones[self._key] = self._zone_ref = zone
+        self.async_write_ha_state()
+        self.hass.async_create_task(self._async_send(zone, pending))
+
+    async def _async_send(self, zone: HvacZone, pending: dict[str, int]) -> None:
+        """Write one merged ActionHvac; roll the optimistic state back on failure."""
+        try:
+            await self.coordinator.async_set_hvac(
+                self._table_id, self._device_id,
+                heat_mode=zone.heat_mode, heat_source=zone.heat_source,
+                fan_mode=zone.fan_mode, low_trip_f=zone.low_trip_f,
+                high_trip_f=zone.high_trip_f,
+                is_setpoint_change="low_trip_f" in pending or "high_trip_f" in pending,
+                is_preset_change="heat_source" in pending,
+            )
+        except BleakError as err:
+            _LOGGER.warning("HVAC command for %s failed: %s", self._key, err)
+            reported = self._reported_zone
+            if reported is None or self.hass is None:
                 return
+            self.coordinator.hvac_zones[self._key] = reported
+            self._zone_ref = self._with_pending(reported)
+            self.async_write_ha_state()
+
+    def _with_pending(self, zone: HvacZone) -> HvacZone:
+        """Overlay changes still waiting in the debounce window onto *zone*."""
+        return replace(zone, **self._pending) if self._pending else zone
+
+    async def async_will_remove_from_hass(self) -> None:
+        if self._cancel_debounce is not None:
+            self._cancel_debounce()
+            self._cancel_debounce = None
+        self._pending.clear()
+
+    @callback
+    def async_handle_zone_update(self, frame: HvacZone) -> None:
+        """Refresh the cached zone after an HvacZone event for this key."""
+        # The pending guard may have suppressed this frame, so take
+        # whatever the coordinator actually stored.
+        zone = self.coordinator.hvac_zones.get(self._key)
+        if zone is frame:
+            self._reported_zone = frame
+        if zone is not None:
+            # Changes still inside the debounce window are not guarded by the
+            # coordinator yet; keep showing them over the older frame.
+            zone = self._with_pending(zone)
+        # Capability is learned even from suppressed frames
+        cap = self.coordinator.observed_hvac_capability.get(self._key, 0)
+        if zone == self._zone_ref and cap == self._cap:
+            return  # periodic re-broadcast of an unchanged zone
+        self._zone_ref = zone
+        self._cap = cap
+        # Coalesce a burst of zone frames into one state write
+        if not self._write_pending:
+            self._write_pending = True
+            self.coordinator.hass.loop.call_soon(self._flush_state)
+
+    @callback
+    def _flush_state(self) -> None:
+        self._write_pending = False
+        if self.hass is not None:
+            self.async_write_ha_state()
@@ -60,6 +60,7 @@ LOCKOUT_CLEAR_THROTTLE = 5.0  # Minimum time between lockout clear attempts
 RECONNECT_BACKOFF_BASE = 5.0  # Initial reconnect delay (doubles per failure)
 RECONNECT_BACKOFF_CAP = 120.0  # Maximum reconnect delay
 STALE_CONNECTION_TIMEOUT = 300.0  # 5 min without events → force reconnect
+UPDATE_COALESCE_DELAY = 0.05  # Batch coordinator updates across a notification burst
 
 # ---------------------------------------------------------------------------
 # Event Types (MyRvLink Protocol — first byte of decoded COBS frame)
@@ -131,6 +132,8 @@ HVAC_CAP_GAS = 0x01
 HVAC_CAP_AC = 0x02
 HVAC_CAP_HEAT_PUMP = 0x04
 HVAC_CAP_MULTISPEED_FAN = 0x08
+# Either heat source present → preset (Gas / Heat Pump) selection is offered
+HVAC_CAP_PRESET_MASK = HVAC_CAP_GAS | HVAC_CAP_HEAT_PUMP
 
 # Heat source preset names (match Android / HA climate preset_mode)
 HVAC_PRESET_GAS = "Prefer Gas"
@@ -15,21 +15,26 @@ Reference: INTERNALS.md § Authentication Flow, § Device Metadata Retrieval
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from datetime import timedelta
+from functools import partial
 import hashlib
+import itertools
 import logging
 import os
+import struct
 import time
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from typing import Any, Callable
 
 from bleak import BleakClient, BleakGATTCharacteristic, BleakScanner
 from bleak.exc import BleakError
-from bleak_retry_connector import establish_connection
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .ble_agent import (
@@ -81,6 +86,7 @@ from .const import (
     STALE_CONNECTION_TIMEOUT,
     UNLOCK_STATUS_CHAR_UUID,
     UNLOCK_VERIFY_DELAY,
+    UPDATE_COALESCE_DELAY,
 )
 from .protocol.cobs import CobsByteDecoder, cobs_encode
 from .protocol.commands import CommandBuilder
@@ -94,6 +100,7 @@ from .protocol.ids_can_wire import (
     parse_ids_can_wire_frame,
 )
 from .protocol.events import (
+    PARSED_EVENT_TYPES,
     CoverStatus,
     DeviceLock,
     DeviceMetadata,
@@ -128,7 +135,23 @@ from .protocol.tea import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Characteristics resolved once per connection during service enumeration.
+_GATT_CHAR_UUIDS = frozenset(
+    {
+        SEED_CHAR_UUID,
+        UNLOCK_STATUS_CHAR_UUID,
+        KEY_CHAR_UUID,
+        DATA_WRITE_CHAR_UUID,
+        DATA_READ_CHAR_UUID,
+        CAN_WRITE_CHAR_UUID,
+        CAN_READ_CHAR_UUID,
+        CAN_VERSION_CHAR_UUID,
+        PASSWORD_UNLOCK_CHAR_UUID,
+    }
+)
+
 _MAX_PENDING_GET_DEVICES_CMDIDS = 128
+_MAX_PENDING_METADATA_CMDIDS = 128
 _STARTUP_BOOTSTRAP_WAIT_SECONDS = 8.0
 # Initial backoff between bootstrap retry attempts (doubles each attempt).
 _STARTUP_BOOTSTRAP_BACKOFF_SECONDS = 1.0
@@ -174,13 +197,55 @@ _RELAY_SEED_FUNCTION_CODES: frozenset[int] = frozenset({
     399,  # Battery Fan
 })
 
+# Lockout clear sequence (arm, then clear ~100 ms later).  The DATA_WRITE
+# fallback frames never change, so they are COBS-encoded once here.
+_LOCKOUT_ARM = b"\x55"
+_LOCKOUT_CLEAR = b"\xaa"
+_LOCKOUT_ARM_FRAME = cobs_encode(_LOCKOUT_ARM)
+_LOCKOUT_CLEAR_FRAME = cobs_encode(_LOCKOUT_CLEAR)
+
+
+# Observed HVAC capability bits implied by each status field (see
+# _update_observed_hvac_capability).  Indexed by active status (low nibble
+# of zone_status), (heat_mode << 2) | heat_source, and fan_mode.
+_STATUS_CAP: tuple[int, ...] = tuple(
+    HVAC_CAP_AC if status == 2
+    else HVAC_CAP_HEAT_PUMP | HVAC_CAP_AC if status == 3
+    else HVAC_CAP_GAS if status in (5, 6)
+    else 0
+    for status in range(16)
+)
+_MODE_SOURCE_CAP: tuple[int, ...] = tuple(
+    (
+        (HVAC_CAP_GAS if source == 0 else HVAC_CAP_HEAT_PUMP if source == 1 else 0)
+        if mode in (1, 3) else 0
+    )
+    | (HVAC_CAP_AC if mode in (2, 3) else 0)
+    for mode in range(8)
+    for source in range(4)
+)
+_FAN_CAP: tuple[int, ...] = (0, 0, HVAC_CAP_MULTISPEED_FAN, 0)
+
+# Command-response field readers: cmdId (bytes 1-2, LE) and the
+# metadata-complete table CRC (bytes 4-7, BE)
+_U16_LE = struct.Struct("<H")
+_U32_BE = struct.Struct(">I")
+
+# Interned keys by packed (table_id << 8) | device_id; both ids are uint8,
+# so this holds at most one string per device ever seen.
+_DEVICE_KEYS: dict[int, str] = {}
+
 
 def _device_key(table_id: int, device_id: int) -> str:
     """Canonical string key for a (table, device) pair."""
-    return f"{table_id:02x}:{device_id:02x}"
+    packed = (table_id << 8) | device_id
+    key = _DEVICE_KEYS.get(packed)
+    if key is None:
+        key = _DEVICE_KEYS[packed] = f"{table_id:02x}:{device_id:02x}"
+    return key
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingHvacCommand:
     """State of an in-flight HVAC BLE command used by the pending guard and retry logic."""
 
@@ -195,6 +260,7 @@ class PendingHvacCommand:
     is_preset_change: bool
     sent_at: float        # time.monotonic() timestamp of last send
     retry_count: int = 0
+    epoch: int = 0        # per-zone send counter; a retry only acts on its own epoch
 
 
 def _decode_v2_ble_can_frames(raw: bytes) -> list[bytes]:
@@ -295,6 +361,15 @@ def _official_can_ble_gateway_version_from_part(data: bytes) -> str:
     return result
 
 
+async def _clear_gatt_cache(client: BleakClient) -> None:
+    """Drop cached GATT services so the next connect rediscovers them."""
+    if isinstance(client, BleakClientWithServiceCache):
+        try:
+            await client.clear_cache()
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.debug("Failed to clear GATT cache: %s", exc)
+
+
 class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinate BLE communication with a OneControl gateway."""
 
@@ -308,6 +383,16 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.entry = entry
         self.address: str = entry.data[CONF_ADDRESS]
+        self._address_upper: str = self.address.upper()
+        # Shared by every entity on this gateway (unique_id prefix + device card)
+        self.mac_clean: str = self.address.replace(":", "").lower()
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.address)},
+            name=f"OneControl {self.address}",
+            manufacturer="Lippert / LCI",
+            model="BLE Gateway",
+            connections={("bluetooth", self.address)},
+        )
         self.gateway_pin: str = entry.data.get(CONF_GATEWAY_PIN, DEFAULT_GATEWAY_PIN)
 
         # ── PIN-based pairing (MyRVLink PIN gateways) ─────────────────
@@ -354,7 +439,9 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Per-table metadata tracking (replaces single _metadata_requested bool)
         self._metadata_requested_tables: set[int] = set()
         self._metadata_loaded_tables: set[int] = set()
-        self._metadata_rejected_tables: set[int] = set()
+        # Non-zero table_ids seen on status events (status dicts are never
+        # cleared, so neither is this)
+        self._tables_seen: set[int] = set()
         self._metadata_retry_counts: dict[int, int] = {}   # table_id → 0x0f retry count
         self._metadata_retry_pending: set[int] = set()      # table_ids with a retry task in flight
         self._pending_metadata_cmdids: dict[int, int] = {}  # cmdId → table_id
@@ -400,6 +487,9 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._consecutive_failures: int = 0
         self._last_lockout_clear: float = 0.0
         self._has_can_write: bool = False
+        # Characteristics resolved during service enumeration (UUID → char);
+        # passing these to Bleak's read/write/notify calls skips its UUID lookup.
+        self._gatt_chars: dict[str, BleakGATTCharacteristic] = {}
         self._is_can_ble: bool = False  # CAN-only gateway — no MyRvLink AUTH/DATA services
         # Survives disconnect/reconnect — marks this entry as an IDS-CAN BLE gateway.
         self._can_ble_confirmed: bool = False
@@ -444,6 +534,12 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # ── Data freshness tracking ──────────────────────────────────
         self._last_event_time: float = 0.0  # monotonic timestamp
+        # data_healthy deadline, moved forward with _last_event_time.
+        # CAN BLE gateways get a wider window (see data_healthy).
+        self._healthy_window: float = 15.0
+        self._healthy_until: float = float("-inf")
+        # Pending coalesced coordinator update (see _schedule_update)
+        self._update_handle: asyncio.TimerHandle | None = None
 
         # ── DTC fault deduplication ──────────────────────────────────
         self._last_dtc_codes: dict[str, int] = {}  # key → last known dtc_code
@@ -451,6 +547,8 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # ── Accumulated state ─────────────────────────────────────────
         self.gateway_info: GatewayInformation | None = None
         self.rv_status: RvStatus | None = None
+        # Coordinator data dict, kept current by the handlers (see _build_data)
+        self._data: dict[str, Any] = {"connected": False, "authenticated": False}
 
         # Per-device state keyed by "TT:DD" hex string
         self.relays: dict[str, RelayStatus] = {}
@@ -470,7 +568,15 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Metadata: friendly names per device key
         self.device_names: dict[str, str] = {}
+        # Bumped whenever device_names changes so entities can cache names
+        self.device_names_version: int = 0
         self._metadata_raw: dict[str, DeviceMetadata] = {}
+        # table_id → keys in _metadata_raw, so a table can be invalidated
+        # without scanning every device
+        self._metadata_keys_by_table: dict[int, set[str]] = {}
+        # Whether a device's resolved name marks it as a gas appliance
+        # (DTC faults are only published for those)
+        self._is_gas_device: dict[str, bool] = {}
 
         # Last non-zero brightness per dimmable device (persists across off/on cycles).
         # Mirrors Android lastKnownDimmableBrightness — only updated when brightness > 0.
@@ -480,21 +586,52 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Mirrors Android lastKnownRgbColor — never overwritten by an off-state frame (R=0,G=0,B=0).
         self._last_known_rgb_color: dict[str, tuple[int, int, int]] = {}
 
+        # Parsed MyRvLink event type → state handler(event, now), used by
+        # _process_frame.  Plain per-device events just land in their dict.
+        self._event_handlers: dict[type, Callable[[Any, float], None]] = {
+            GatewayInformation: self._handle_gateway_info,
+            RvStatus: self._handle_rv_status,
+            RelayStatus: self._handle_relay_status,
+            DimmableLight: self._handle_dimmable_light,
+            RgbLight: self._handle_rgb_light,
+            CoverStatus: partial(self._store_device_event, self.covers),
+            TankLevel: partial(self._store_device_event, self.tanks),
+            HvacZone: self._handle_hvac_zone,
+            DeviceOnline: partial(self._store_device_event, self.device_online),
+            SystemLockout: self._handle_system_lockout,
+            DeviceLock: partial(self._store_device_event, self.device_locks),
+            GeneratorStatus: partial(self._store_device_event, self.generators),
+            HourMeter: partial(self._store_device_event, self.hour_meters),
+            LevelerStatus: partial(self._store_device_event, self.levelers),
+            TankAlert: partial(self._store_device_event, self.tank_alerts),
+            RealTimeClock: self._handle_rtc,
+            DeviceMetadata: self._handle_metadata,
+        }
+
         # ── HVAC debounce / pending guard / retry ─────────────────────
         # Pending command guard: suppresses stale gateway echoes during command window.
         # Mirrors Android pendingHvacCommands.
         self._pending_hvac: dict[str, PendingHvacCommand] = {}
-        # Command merge baseline: kept in sync with hvac_zones but only updated
-        # after the pending guard passes (so suppressed echoes don't corrupt merges).
-        self._hvac_zone_states: dict[str, HvacZone] = {}
+        # Per-zone send counter stamped into each PendingHvacCommand.
+        self._hvac_epoch: dict[str, int] = {}
         # Observed capability bitmask learned from status events.
         # Mirrors Android observedHvacCapability (bit0=Gas, bit1=AC, bit2=HeatPump, bit3=Fan).
         self.observed_hvac_capability: dict[str, int] = {}
-        # Asyncio timer handles for setpoint retry (one per zone).
-        self._hvac_retry_handles: dict[str, asyncio.TimerHandle] = {}
+        # Single task re-sending unconfirmed setpoints for all zones.
+        self._setpoint_retry_task: asyncio.Task | None = None
 
         # Entity platform callbacks (typed)
-        self._event_callbacks: list[Callable[[Any], None]] = []
+        # Registration token → callback (O(1) unsubscribe)
+        self._event_callbacks: dict[int, Callable[[Any], None]] = {}
+        self._callbacks_by_type: dict[type, dict[int, Callable[[Any], None]]] = {}
+        # Event type → (table_id, device_id) → token → state-write callback
+        self._callbacks_by_device: dict[
+            type, dict[tuple[int, int], dict[int, Callable[[], None]]]
+        ] = {}
+        self._callback_tokens = itertools.count()
+        # Events queued for the next callback flush (one flush per loop pass)
+        self._event_queue: deque[Any] = deque()
+        self._event_flush_scheduled = False
 
     @property
     def instance_tag(self) -> str:
@@ -515,16 +652,12 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     @property
     def data_healthy(self) -> bool:
         """Return True if we've received data recently."""
-        if self._last_event_time == 0.0:
-            return False
         # IDS-CAN BLE gateways may disconnect after each broadcast cycle
         # and reconnect every ~5-10s.  Don't require _connected so entities stay available
-        # between cycles; use a 30s staleness window instead.
-        if self._can_ble_confirmed:
-            return (time.monotonic() - self._last_event_time) < 30.0
-        if not self._connected:
+        # between cycles; _healthy_window is 30s instead of 15s for them.
+        if not self._connected and not self._can_ble_confirmed:
             return False
-        return (time.monotonic() - self._last_event_time) < 15.0
+        return time.monotonic() < self._healthy_until
 
     @property
     def is_can_ble_gateway(self) -> bool:
@@ -597,27 +730,110 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         key = _device_key(table_id, device_id)
         return self.device_names.get(key, f"Device {key.upper()}")
 
-    def register_event_callback(self, cb: Callable[[Any], None]) -> Callable[[], None]:
-        """Register a callback for parsed events. Returns unsubscribe callable."""
-        self._event_callbacks.append(cb)
+    def register_event_callback(
+        self, cb: Callable[[Any], None], event_type: type | None = None
+    ) -> Callable[[], None]:
+        """Register a callback for parsed events. Returns unsubscribe callable.
+
+        With ``event_type`` the callback only receives items of exactly that
+        type, one at a time (list events are unpacked).  Without it the
+        callback receives every raw event.
+        """
+        callbacks = (
+            self._event_callbacks
+            if event_type is None
+            else self._callbacks_by_type.setdefault(event_type, {})
+        )
+        token = next(self._callback_tokens)
+        callbacks[token] = cb
+
+        def _unsub() -> None:
+            callbacks.pop(token, None)
+
+        return _unsub
+
+    def register_device_callback(
+        self, event_type: type, table_id: int, device_id: int, cb: Callable[[Any], None]
+    ) -> Callable[[], None]:
+        """Call ``cb(item)`` for each ``event_type`` item addressed to one device.
+
+        Lookup is a single dict hit per event item, so entities don't each
+        filter every event.  Returns an unsubscribe callable.
+        """
+        callbacks = self._callbacks_by_device.setdefault(event_type, {}).setdefault(
+            (table_id, device_id), {}
+        )
+        token = next(self._callback_tokens)
+        callbacks[token] = cb
 
         def _unsub() -> None:
-            if cb in self._event_callbacks:
-                self._event_callbacks.remove(cb)
+            callbacks.pop(token, None)
 
         return _unsub
 
+    def _queue_event(self, event: Any) -> None:
+        """Queue an event for entity callbacks; bursts share one flush."""
+        self._event_queue.append(event)
+        if not self._event_flush_scheduled:
+            self._event_flush_scheduled = True
+            self.hass.loop.call_soon(self._flush_events)
+
+    @callback
+    def _flush_events(self) -> None:
+        """Deliver all queued events to registered callbacks."""
+        self._event_flush_scheduled = False
+        queue = self._event_queue
+        by_type = self._callbacks_by_type
+        by_device = self._callbacks_by_device
+        while queue:
+            event = queue.popleft()
+            # Snapshot: discovery callbacks register new entities mid-flush
+            for cb in tuple(self._event_callbacks.values()):
+                try:
+                    cb(event)
+                except Exception:  # noqa: BLE001
+                    _LOGGER.exception("Error in event callback")
+            if not by_type and not by_device:
+                continue
+            for item in event if isinstance(event, list) else (event,):
+                item_type = type(item)
+                typed = by_type.get(item_type)
+                if typed:
+                    for cb in tuple(typed.values()):
+                        try:
+                            cb(item)
+                        except Exception:  # noqa: BLE001
+                            _LOGGER.exception("Error in event callback")
+                per_device = by_device.get(item_type)
+                if per_device:
+                    device_cbs = per_device.get((item.table_id, item.device_id))
+                    if device_cbs:
+                        for cb in tuple(device_cbs.values()):
+                            try:
+                                cb(item)
+                            except Exception:  # noqa: BLE001
+                                _LOGGER.exception("Error in event callback")
+
     # ------------------------------------------------------------------
     # Command sending (COBS-encoded writes to DATA_WRITE)
     # ------------------------------------------------------------------
 
+    def _char(self, uuid: str) -> BleakGATTCharacteristic | str:
+        """Return the resolved characteristic for *uuid*, or the UUID itself."""
+        return self._gatt_chars.get(uuid, uuid)
+
     async def async_send_command(self, raw_command: bytes) -> None:
         """COBS-encode and write a command to the gateway."""
         if not self._client or not self._connected:
             raise BleakError("Not connected to gateway")
         encoded = cobs_encode(raw_command)
-        _LOGGER.debug("TX command (%d bytes raw): %s", len(raw_command), raw_command.hex())
-        await self._client.write_gatt_char(DATA_WRITE_CHAR_UUID, encoded, response=False)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "TX command (%d bytes raw): %s", len(raw_command), raw_command.hex()
+            )
+        await self._client.write_gatt_char(
+            self._char(DATA_WRITE_CHAR_UUID), encoded, response=False
+        )
 
     def _encode_ble_v2_twenty_nine_bit(self, frame: bytes) -> bytes:
         """Encode raw extended IDS-CAN wire frame into BLE V2 TwentyNineBit format.
@@ -637,8 +853,11 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Official app path writes CAN adapter frames directly to IDS CAN WRITE.
         # Keep TX as raw IDS wire frame (e.g. [dlc][id(4)][payload] for 29-bit)
         # instead of wrapping in BLE V2 0x03 format.
-        _LOGGER.debug("CAN BLE: %s RAW tx=%s", label, frame.hex())
-        await client.write_gatt_char(CAN_WRITE_CHAR_UUID, frame, response=False)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("CAN BLE: %s RAW tx=%s", label, frame.hex())
+        await client.write_gatt_char(
+            self._char(CAN_WRITE_CHAR_UUID), frame, response=False
+        )
 
     def _is_can_ble_v1_gateway(self) -> bool:
         """Return True when official app would use IdsCanSessionManagerAuto."""
@@ -808,6 +1027,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         await self.async_send_command(cmd)
 
         key = _device_key(table_id, device_id)
+        epoch = self._hvac_epoch[key] = self._hvac_epoch.get(key, 0) + 1
         self._pending_hvac[key] = PendingHvacCommand(
             table_id=table_id,
             device_id=device_id,
@@ -819,9 +1039,10 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             is_setpoint_change=is_setpoint_change,
             is_preset_change=is_preset_change,
             sent_at=time.monotonic(),
+            epoch=epoch,
         )
         if is_setpoint_change:
-            self._schedule_setpoint_retry(key)
+            self._ensure_setpoint_retry_task()
 
     def _is_startup_bootstrap_active(self, table_id: int | None = None) -> bool:
         """Return True while the serialized startup query flow is active."""
@@ -997,25 +1218,13 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         reveal new capabilities even if GetDevicesMetadata returns 0x00.
         """
         prev = self.observed_hvac_capability.get(zone_key, 0)
-        cap = prev
-
         active_status = zone.zone_status & 0x0F
-        if active_status == 2:
-            cap |= HVAC_CAP_AC
-        elif active_status == 3:
-            cap |= HVAC_CAP_HEAT_PUMP | HVAC_CAP_AC
-        elif active_status in (5, 6):
-            cap |= HVAC_CAP_GAS
-
-        if zone.heat_mode in (1, 3):
-            if zone.heat_source == 0:
-                cap |= HVAC_CAP_GAS
-            elif zone.heat_source == 1:
-                cap |= HVAC_CAP_HEAT_PUMP
-        if zone.heat_mode in (2, 3):
-            cap |= HVAC_CAP_AC
-        if zone.fan_mode == 2:
-            cap |= HVAC_CAP_MULTISPEED_FAN
+        cap = (
+            prev
+            | _STATUS_CAP[active_status]
+            | _MODE_SOURCE_CAP[((zone.heat_mode & 0x07) << 2) | (zone.heat_source & 0x03)]
+            | _FAN_CAP[zone.fan_mode & 0x03]
+        )
 
         if cap != prev:
             self.observed_hvac_capability[zone_key] = cap
@@ -1025,8 +1234,8 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 active_status, zone.heat_mode, zone.heat_source, zone.fan_mode,
             )
 
-    def _handle_hvac_zone(self, zone: HvacZone) -> None:
-        """Apply the pending command guard and update hvac_zones / _hvac_zone_states.
+    def _handle_hvac_zone(self, zone: HvacZone, now: float) -> None:
+        """Apply the pending command guard and update hvac_zones.
 
         Always updates observed capability and triggers metadata request.
         Only updates state dicts if the event is not suppressed by the guard.
@@ -1038,58 +1247,73 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         pending = self._pending_hvac.get(key)
         if pending is not None:
-            age = time.monotonic() - pending.sent_at
+            age = now - pending.sent_at
             window = (
                 HVAC_PRESET_PENDING_WINDOW_S if pending.is_preset_change
                 else HVAC_SETPOINT_PENDING_WINDOW_S if pending.is_setpoint_change
                 else HVAC_PENDING_WINDOW_S
             )
             if age <= window:
-                low_ok = abs(zone.low_trip_f - pending.low_trip_f) <= 1
-                high_ok = abs(zone.high_trip_f - pending.high_trip_f) <= 1
+                # Exact fields first; setpoints allow ±1°F rounding
                 matches = (
                     zone.heat_mode == pending.heat_mode
                     and zone.heat_source == pending.heat_source
                     and zone.fan_mode == pending.fan_mode
-                    and low_ok and high_ok
+                    and -1 <= zone.low_trip_f - pending.low_trip_f <= 1
+                    and -1 <= zone.high_trip_f - pending.high_trip_f <= 1
                 )
                 if not matches:
-                    _LOGGER.debug(
-                        "HVAC guard: suppressing stale echo for %s (age=%.1fs window=%.0fs)",
-                        key, age, window,
-                    )
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "HVAC guard: suppressing stale echo for %s (age=%.1fs window=%.0fs)",
+                            key, age, window,
+                        )
                     return  # suppress — do not update hvac_zones
                 # Matched — gateway confirmed our command
                 if not pending.is_preset_change:
                     # Clear pending immediately (preset guard holds full window)
                     self._pending_hvac.pop(key, None)
-                    if key in self._hvac_retry_handles:
-                        self._hvac_retry_handles.pop(key).cancel()
                     _LOGGER.debug("HVAC guard: command confirmed for %s (age=%.1fs)", key, age)
             else:
                 # Window expired — clear stale pending
                 self._pending_hvac.pop(key, None)
 
         self.hvac_zones[key] = zone
-        self._hvac_zone_states[key] = zone
 
-    def _schedule_setpoint_retry(self, zone_key: str) -> None:
-        """Schedule a setpoint verification/retry check after HVAC_SETPOINT_RETRY_DELAY_S.
+    def _ensure_setpoint_retry_task(self) -> None:
+        """Start the setpoint retry task if it is not already running."""
+        if self._setpoint_retry_task is None or self._setpoint_retry_task.done():
+            self._setpoint_retry_task = self.hass.async_create_task(
+                self._setpoint_retry_loop()
+            )
+
+    async def _setpoint_retry_loop(self) -> None:
+        """Re-send setpoints still unconfirmed HVAC_SETPOINT_RETRY_DELAY_S after sending.
 
         Mirrors Android scheduleSetpointVerification() — WRITE_TYPE_NO_RESPONSE
         can be silently dropped by the BLE stack; this ensures eventual delivery.
+        One task serves every zone and exits once no setpoint is pending.
         """
-        if zone_key in self._hvac_retry_handles:
-            self._hvac_retry_handles.pop(zone_key).cancel()
-
-        def _callback() -> None:
-            self.hass.async_create_task(self._do_retry_setpoint(zone_key))
-
-        self._hvac_retry_handles[zone_key] = self.hass.loop.call_later(
-            HVAC_SETPOINT_RETRY_DELAY_S, _callback
-        )
+        while True:
+            due = {
+                key: (pending.sent_at + HVAC_SETPOINT_RETRY_DELAY_S, pending.epoch)
+                for key, pending in self._pending_hvac.items()
+                if pending.is_setpoint_change
+            }
+            if not due:
+                return
+            delay = min(when for when, _ in due.values()) - time.monotonic()
+            if delay > 0:
+                # Re-evaluate after sleeping: confirmations and new sends
+                # change the pending set meanwhile.
+                await asyncio.sleep(delay)
+                continue
+            now = time.monotonic()
+            for key, (when, epoch) in due.items():
+                if when <= now:
+                    await self._do_retry_setpoint(key, epoch)
 
-    async def _do_retry_setpoint(self, zone_key: str) -> None:
+    async def _do_retry_setpoint(self, zone_key: str, epoch: int) -> None:
         """Re-send an unconfirmed HVAC setpoint command.
 
         Uses exact values from PendingHvacCommand — no re-merging.
@@ -1098,6 +1322,8 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         pending = self._pending_hvac.get(zone_key)
         if pending is None or not pending.is_setpoint_change:
             return  # already confirmed — nothing to do
+        if pending.epoch != epoch:
+            return  # superseded by a newer command since the due time was taken
         if pending.retry_count >= HVAC_SETPOINT_MAX_RETRIES:
             _LOGGER.warning(
                 "HVAC setpoint retries exhausted (%d) for %s — giving up",
@@ -1110,18 +1336,19 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             pending.retry_count + 1, HVAC_SETPOINT_MAX_RETRIES, zone_key,
             pending.low_trip_f, pending.high_trip_f,
         )
+        # Count the attempt before sending so a failed write is not retried
+        # in a tight loop.
+        pending.retry_count += 1
+        pending.sent_at = time.monotonic()
         cmd = self._cmd.build_action_hvac(
             pending.table_id, pending.device_id,
             pending.heat_mode, pending.heat_source, pending.fan_mode,
             pending.low_trip_f, pending.high_trip_f,
         )
-        await self.async_send_command(cmd)
-        self._pending_hvac[zone_key] = replace(
-            pending,
-            retry_count=pending.retry_count + 1,
-            sent_at=time.monotonic(),
-        )
-        self._schedule_setpoint_retry(zone_key)
+        try:
+            await self.async_send_command(cmd)
+        except BleakError as err:
+            _LOGGER.debug("HVAC setpoint retry for %s failed: %s", zone_key, err)
 
     async def async_set_generator(
         self, table_id: int, device_id: int, run: bool
@@ -1174,24 +1401,21 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not self._client or not self._connected:
             raise BleakError("Not connected to gateway")
 
-        arm = bytes([0x55])
-        clear = bytes([0xAA])
-
+        # The 100 ms gap is part of the gateway's arm/clear handshake and
+        # must not be collapsed into back-to-back writes.
         if self._has_can_write:
+            char = self._char(CAN_WRITE_CHAR_UUID)
             _LOGGER.info("Lockout clear: writing 0x55 → CAN_WRITE")
-            await self._client.write_gatt_char(CAN_WRITE_CHAR_UUID, arm, response=False)
+            await self._client.write_gatt_char(char, _LOCKOUT_ARM, response=False)
             await asyncio.sleep(0.1)
             _LOGGER.info("Lockout clear: writing 0xAA → CAN_WRITE")
-            await self._client.write_gatt_char(CAN_WRITE_CHAR_UUID, clear, response=False)
+            await self._client.write_gatt_char(char, _LOCKOUT_CLEAR, response=False)
         else:
             _LOGGER.info("Lockout clear: CAN_WRITE not available, using DATA_WRITE fallback")
-            await self._client.write_gatt_char(
-                DATA_WRITE_CHAR_UUID, cobs_encode(arm), response=False
-            )
+            char = self._char(DATA_WRITE_CHAR_UUID)
+            await self._client.write_gatt_char(char, _LOCKOUT_ARM_FRAME, response=False)
             await asyncio.sleep(0.1)
-            await self._client.write_gatt_char(
-                DATA_WRITE_CHAR_UUID, cobs_encode(clear), response=False
-            )
+            await self._client.write_gatt_char(char, _LOCKOUT_CLEAR_FRAME, response=False)
 
     async def async_refresh_metadata(self) -> None:
         """Re-request device metadata for all known table IDs."""
@@ -1201,15 +1425,16 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             return
 
-        # Reset per-table state so all tables can be re-requested
-        self._metadata_requested_tables.clear()
-        self._metadata_loaded_tables.clear()
-        self._metadata_rejected_tables.clear()
-        self._metadata_retry_counts.clear()
-        self._metadata_retry_pending.clear()
-        self._pending_metadata_cmdids.clear()
-        self._pending_metadata_entries.clear()
-        self._pending_get_devices_cmdids.clear()
+        # Reset per-table state so all tables can be re-requested.  Fresh
+        # containers rather than clear() so tables grown by an earlier
+        # refresh storm are released instead of kept at their peak size.
+        self._metadata_requested_tables = set()
+        self._metadata_loaded_tables = set()
+        self._metadata_retry_counts = {}
+        self._metadata_retry_pending = set()
+        self._pending_metadata_cmdids = {}
+        self._pending_metadata_entries = {}
+        self._pending_get_devices_cmdids = {}
 
         # Collect all known table IDs: gateway, previously loaded metadata,
         # and all observed device status tables (covers tables we saw via status
@@ -1219,15 +1444,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             table_ids.add(self.gateway_info.table_id)
         for meta in self._metadata_raw.values():
             table_ids.add(meta.table_id)
-        for status_dict in (
-            self.relays, self.dimmable_lights, self.rgb_lights, self.covers,
-            self.hvac_zones, self.tanks, self.device_online, self.device_locks,
-            self.generators, self.hour_meters, self.levelers, self.tank_alerts, self.unknown_devices,
-        ):
-            for key in status_dict:
-                t = int(key.split(":")[0], 16)
-                if t != 0:
-                    table_ids.add(t)
+        table_ids |= self._tables_seen
         for tid in sorted(table_ids):
             await self._send_metadata_request(tid)
 
@@ -1256,6 +1473,12 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._closed = True
         self._stop_heartbeat()
         self._cancel_startup_bootstrap()
+        if self._setpoint_retry_task is not None:
+            self._setpoint_retry_task.cancel()
+            self._setpoint_retry_task = None
+        if self._update_handle is not None:
+            self._update_handle.cancel()
+            self._update_handle = None
         self._cancel_reconnect()
         self._connected = False
         self._authenticated = False
@@ -1351,7 +1574,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hci_adapters = ["hci0"]
         if not hci_adapters:
             hci_adapters = ["hci0"]
-        for adapter in hci_adapters:
+        for adapter in self._order_direct_adapters(hci_adapters):
             if self._closed:
                 return
             _LOGGER.info(
@@ -1421,6 +1644,8 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # usable via the local radio.
         locally_bonded = await async_is_locally_bonded(self.address)
         local_macs = await async_get_local_adapter_macs()
+        # Colon-less adapter MACs, compared against each candidate's source
+        local_sources = {m.replace(":", "") for m in local_macs}
         candidate_sources = [c.scanner.source for c in candidates]
         _LOGGER.debug(
             "Bond check %s: locally_bonded=%s local_macs=%s candidate_sources=%s",
@@ -1435,8 +1660,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if self.is_pin_gateway and candidates:
             _pin_local = next(
                 (c for c in candidates
-                 if c.scanner.source.upper().replace(":", "") in
-                    {m.replace(":", "") for m in local_macs}),
+                 if c.scanner.source.upper().replace(":", "") in local_sources),
                 None,
             )
             if _pin_local is not None:
@@ -1457,8 +1681,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if device is None and locally_bonded and candidates:
             local_candidate = next(
                 (c for c in candidates
-                 if c.scanner.source.upper().replace(":", "") in
-                    {m.replace(":", "") for m in local_macs}),
+                 if c.scanner.source.upper().replace(":", "") in local_sources),
                 None,
             )
             if local_candidate is not None:
@@ -1500,15 +1723,13 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Capture the source so we can persist it on auth success.
                 # Prefer a local HCI adapter (MAC-address source) over a proxy
                 # so that the D-Bus agent works and the LTK is stored locally.
-                addr_upper = self.address.upper()
                 addr_candidates = [
                     c for c in candidates
-                    if c.ble_device.address.upper() == addr_upper
+                    if c.ble_device.address.upper() == self._address_upper
                 ]
                 local_preferred = next(
                     (c for c in addr_candidates
-                     if c.scanner.source.upper().replace(":", "") in
-                        {m.replace(":", "") for m in local_macs}),
+                     if c.scanner.source.upper().replace(":", "") in local_sources),
                     None,
                 )
                 matched = local_preferred or (addr_candidates[0] if addr_candidates else None)
@@ -1583,7 +1804,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         try:
             client = await establish_connection(
-                BleakClient,
+                BleakClientWithServiceCache,
                 device,
                 self.address,
                 disconnected_callback=self._on_disconnect,
@@ -1596,6 +1817,26 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._pin_agent_ctx = None
             raise
 
+    def _order_direct_adapters(self, adapters: list[str]) -> list[str]:
+        """Order fallback adapters so the ones hearing the gateway go first.
+
+        Adapters whose HA scanner currently sees the gateway are tried
+        strongest-RSSI first; the rest keep their original order.  A busy or
+        out-of-range adapter then no longer blocks the one that can connect.
+        """
+        try:
+            candidates = bluetooth.async_scanner_devices_by_address(
+                self.hass, self.address, connectable=True
+            )
+        except Exception:  # API unavailable on this HA version
+            return adapters
+        rssi: dict[str, int] = {}
+        for c in candidates:
+            adapter = getattr(c.scanner, "adapter", None)
+            if adapter in adapters:
+                rssi[adapter] = max(rssi.get(adapter, -255), c.advertisement.rssi)
+        return sorted(adapters, key=lambda a: (a not in rssi, -rssi.get(a, 0)))
+
     async def _try_connect_direct(self, adapter: str) -> None:
         """Connect directly via a local HCI adapter, bypassing HA routing.
 
@@ -1611,22 +1852,18 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.address, adapter, self._pairing_method,
         )
 
-        ble_device = None
-        scanner = BleakScanner(adapter=adapter)
+        # Returns as soon as the gateway advertises instead of always
+        # scanning for the full window.  The throwaway scanner is cheap: Bleak
+        # routes every BlueZ scanner through one process-wide D-Bus manager.
         try:
-            await scanner.start()
-            await asyncio.sleep(5.0)
-            await scanner.stop()
+            ble_device = await BleakScanner.find_device_by_address(
+                self.address, timeout=5.0, adapter=adapter
+            )
         except (BleakError, OSError) as scan_exc:
             raise BleakError(
                 f"Scan on {adapter} failed (adapter may not exist): {scan_exc}"
             ) from scan_exc
 
-        for dev in scanner.discovered_devices:
-            if dev.address.upper() == self.address.upper():
-                ble_device = dev
-                break
-
         if ble_device is None:
             raise BleakError(f"Device {self.address} not found in scan on {adapter}")
 
@@ -1667,7 +1904,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._push_button_dbus_ok = True
 
         client = await establish_connection(
-            BleakClient,
+            BleakClientWithServiceCache,
             ble_device,
             self.address,
             disconnected_callback=self._on_disconnect,
@@ -1809,15 +2046,18 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if services:
                 svc_uuids = [s.uuid for s in services]
                 _LOGGER.debug("GATT services: %s", svc_uuids)
+                gatt_chars = {
+                    char.uuid: char
+                    for svc in services
+                    for char in svc.characteristics
+                    if char.uuid in _GATT_CHAR_UUIDS
+                }
+                self._gatt_chars = gatt_chars
                 # Check for CAN_WRITE and UNLOCK_STATUS to identify gateway protocol
-                _has_unlock_status = False
-                for svc in services:
-                    for char in svc.characteristics:
-                        if char.uuid == CAN_WRITE_CHAR_UUID:
-                            self._has_can_write = True
-                            _LOGGER.debug("CAN_WRITE characteristic available")
-                        if char.uuid == UNLOCK_STATUS_CHAR_UUID:
-                            _has_unlock_status = True
+                _has_unlock_status = UNLOCK_STATUS_CHAR_UUID in gatt_chars
+                if CAN_WRITE_CHAR_UUID in gatt_chars:
+                    self._has_can_write = True
+                    _LOGGER.debug("CAN_WRITE characteristic available")
                 # CAN-only gateways expose CAN service but no MyRvLink AUTH service.
                 # X180T exposes the key/seed auth service as well, but official
                 # app still routes it through the CAN-BLE adapter.
@@ -1827,8 +2067,14 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         "CAN BLE gateway detected%s — will use IDS-CAN BLE path",
                         " (X180T)" if self.is_x180t_gateway else " (no UNLOCK_STATUS)",
                     )
+                if not self._has_can_write and DATA_WRITE_CHAR_UUID not in gatt_chars:
+                    # Services came from a stale cache (e.g. gateway firmware
+                    # update) — force a fresh discovery on the next connect.
+                    _LOGGER.warning("Gateway characteristics missing — clearing GATT cache")
+                    await _clear_gatt_cache(client)
             else:
                 _LOGGER.warning("No GATT services discovered")
+                await _clear_gatt_cache(client)
         except Exception as exc:
             _LOGGER.warning("Failed to enumerate services: %s", exc)
 
@@ -1896,18 +2142,18 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # expose these characteristics and may be required before writes are honored.
         unlock_success = False
         try:
-            seed_data = await client.read_gatt_char(UNLOCK_STATUS_CHAR_UUID)
+            seed_data = await client.read_gatt_char(self._char(UNLOCK_STATUS_CHAR_UUID))
             if seed_data.lower() == b"unlocked":
                 _LOGGER.debug("CAN BLE: key/seed unlock already verified")
                 unlock_success = True
             elif len(seed_data) >= 4:
-                seed = bytes(seed_data[:4])
+                seed = seed_data[:4]
                 cipher = X180T_KEY_SEED_CIPHER if self.is_x180t_gateway else CAN_BLE_KEY_SEED_CIPHER
                 key = calculate_can_ble_key_seed_key(seed, cipher)
                 _LOGGER.debug("CAN BLE: key/seed unlock seed=%s key=computed", seed.hex())
-                await client.write_gatt_char(KEY_CHAR_UUID, key, response=True)
+                await client.write_gatt_char(self._char(KEY_CHAR_UUID), key, response=True)
                 await asyncio.sleep(0.5)
-                verify = await client.read_gatt_char(UNLOCK_STATUS_CHAR_UUID)
+                verify = await client.read_gatt_char(self._char(UNLOCK_STATUS_CHAR_UUID))
                 _LOGGER.debug("CAN BLE: key/seed unlock verify=%s", verify.hex())
                 # Only accept explicit unlocked status values to avoid false positives
                 # from textual or status-style responses.
@@ -1931,7 +2177,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Official app selects session strategy from this value:
         # V1 => IdsCanSessionManagerAuto (no explicit seed/key), V2/V2_D => explicit session open.
         try:
-            version_data = bytes(await client.read_gatt_char(CAN_VERSION_CHAR_UUID))
+            version_data = bytes(await client.read_gatt_char(self._char(CAN_VERSION_CHAR_UUID)))
             decoded_version = _official_can_ble_gateway_version_from_part(version_data)
             self._can_ble_gateway_version = decoded_version
             _LOGGER.debug(
@@ -1952,7 +2198,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Skip PASSWORD_UNLOCK for X180T gateways as they use key/seed unlock only
         if not self.is_x180t_gateway:
             try:
-                lock_data = await client.read_gatt_char(PASSWORD_UNLOCK_CHAR_UUID)
+                lock_data = await client.read_gatt_char(self._char(PASSWORD_UNLOCK_CHAR_UUID))
                 locked = len(lock_data) == 0 or lock_data[0] == 0x00
                 _LOGGER.debug(
                     "CAN BLE: PASSWORD_UNLOCK read = %s (locked=%s)", lock_data.hex(), locked
@@ -1965,10 +2211,10 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     verify = b""
                     for attempt in range(2):
                         await client.write_gatt_char(
-                            PASSWORD_UNLOCK_CHAR_UUID, pin_bytes, response=False
+                            self._char(PASSWORD_UNLOCK_CHAR_UUID), pin_bytes, response=False
                         )
                         await asyncio.sleep(1.0)
-                        verify = await client.read_gatt_char(PASSWORD_UNLOCK_CHAR_UUID)
+                        verify = await client.read_gatt_char(self._char(PASSWORD_UNLOCK_CHAR_UUID))
                         if len(verify) > 0 and verify[0] != 0x00:
                             unlock_ok = True
                             break
@@ -1993,7 +2239,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         if self._can_ble_gateway_version == "Unknown":
             try:
-                version_data = bytes(await client.read_gatt_char(CAN_VERSION_CHAR_UUID))
+                version_data = bytes(await client.read_gatt_char(self._char(CAN_VERSION_CHAR_UUID)))
                 decoded_version = _official_can_ble_gateway_version_from_part(version_data)
                 self._can_ble_gateway_version = decoded_version
                 _LOGGER.debug(
@@ -2012,13 +2258,15 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # --- Subscribe CAN_READ for inbound frames ---
         try:
-            await client.start_notify(CAN_READ_CHAR_UUID, self._on_can_read)
+            await client.start_notify(
+                self._char(CAN_READ_CHAR_UUID), self._on_can_read
+            )
             _LOGGER.debug("CAN BLE: subscribed to CAN_READ (%s)", CAN_READ_CHAR_UUID)
             await asyncio.sleep(0.1)  # Brief delay to allow subscription to settle
             
             # Try reading one CAN_READ byte to verify subscription is active
             try:
-                test_read = await client.read_gatt_char(CAN_READ_CHAR_UUID)
+                test_read = await client.read_gatt_char(self._char(CAN_READ_CHAR_UUID))
                 _LOGGER.debug("CAN BLE: CAN_READ subscription verified (test read: %d bytes)", len(test_read))
             except Exception as read_exc:
                 _LOGGER.debug("CAN BLE: CAN_READ test read not available: %s (normal for notify-only)", read_exc)
@@ -2029,6 +2277,9 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         self._authenticated = True
         self._can_ble_confirmed = True
+        self._healthy_window = 30.0
+        if self._last_event_time:
+            self._healthy_until = self._last_event_time + 30.0
         self._can_read_subscribed = True  # auth complete; live relay commands now safe
         self.async_set_updated_data(self._build_data())
         _LOGGER.info("CAN BLE gateway %s — authenticated", self.address)
@@ -2073,8 +2324,10 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         raw = bytes(data)
         # Update last event time for keepalive tracking
-        self._last_event_time = time.monotonic()
-        if len(raw) > 0:
+        self._last_event_time = now = time.monotonic()
+        self._healthy_until = now + self._healthy_window
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug and len(raw) > 0:
             _LOGGER.debug("CAN RX raw (%d bytes, type=0x%02X): %s", len(raw), raw[0] if raw else 0, raw.hex())
         can_frames = _decode_v2_ble_can_frames(raw)
         if not can_frames:
@@ -2096,7 +2349,10 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             decoded = decode_ids_can_payload(wire)
             if wire.message_type == 0x07:
                 self._can_time_source = wire.source_address & 0xFF
-            if self._rc_session_seed_future is not None or self._rc_session_key_future is not None:
+            if debug and (
+                self._rc_session_seed_future is not None
+                or self._rc_session_key_future is not None
+            ):
                 _LOGGER.debug(
                     "CAN BLE: SESSION_WAIT RX mt=0x%02X src=0x%02X tgt=%s mdata=%s payload=%s",
                     wire.message_type,
@@ -2105,17 +2361,18 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     f"0x{wire.message_data:02X}" if wire.message_data is not None else "N/A",
                     wire.payload.hex(),
                 )
-            _LOGGER.debug(
-                "PACKET RX IDS mt=0x%02X(%s) src=0x%02X tgt=%s mdata=%s dlc=%d payload=%s%s",
-                wire.message_type,
-                ids_can_message_type_name(wire.message_type),
-                wire.source_address,
-                f"0x{wire.target_address:02X}" if wire.target_address is not None else "N/A",
-                f"0x{wire.message_data:02X}" if wire.message_data is not None else "N/A",
-                wire.dlc,
-                wire.payload.hex(),
-                format_ids_can_payload(decoded),
-            )
+            if debug:
+                _LOGGER.debug(
+                    "PACKET RX IDS mt=0x%02X(%s) src=0x%02X tgt=%s mdata=%s dlc=%d payload=%s%s",
+                    wire.message_type,
+                    ids_can_message_type_name(wire.message_type),
+                    wire.source_address,
+                    f"0x{wire.target_address:02X}" if wire.target_address is not None else "N/A",
+                    f"0x{wire.message_data:02X}" if wire.message_data is not None else "N/A",
+                    wire.dlc,
+                    wire.payload.hex(),
+                    format_ids_can_payload(decoded),
+                )
             # Learn controller source only from extended request/command traffic.
             # DEVICE_STATUS/NETWORK source addresses are often endpoint devices,
             # not the host-side controller address used for outgoing requests.
@@ -2133,7 +2390,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         learned_source,
                     )
                     self._gateway_can_address = learned_source
-            if wire.message_type >= 0x80:
+            if debug and wire.message_type >= 0x80:
                 _LOGGER.debug(
                     "CAN BLE: EXT RX mt=0x%02X src=0x%02X tgt=%s mdata=%s payload=%s",
                     wire.message_type,
@@ -2207,28 +2464,32 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
             self.system_lockout_level = agg_lockout
-            self.gateway_info = GatewayInformation(
+            self._set_gateway_info(GatewayInformation(
                 protocol_version=agg_proto,
                 table_id=0,
                 device_count=len(self._can_device_types),
-            )
-            self._last_event_time = time.monotonic()
+            ))
+            self._last_event_time = now = time.monotonic()
+            self._healthy_until = now + self._healthy_window
             if changed:
-                self.async_set_updated_data(self._build_data())
+                self._schedule_update()
             return
 
         if mt == 0x02 and decoded is not None:  # DEVICE_ID
             dev_type = int(decoded.fields.get("device_type", 0))
             label = str(decoded.fields.get("function_label", f"Device 0x{src:02X}"))
             self._can_device_types[src] = dev_type
-            self.device_names[_device_key(0, src)] = label
+            key = _device_key(0, src)
+            if self.device_names.get(key) != label:
+                self.device_names[key] = label
+                self.device_names_version += 1
             # Refresh device_count in gateway_info after each new device is seen
             if self.gateway_info is not None:
-                self.gateway_info = GatewayInformation(
+                self._set_gateway_info(GatewayInformation(
                     protocol_version=self.gateway_info.protocol_version,
                     table_id=0,
                     device_count=len(self._can_device_types),
-                )
+                ))
             return
 
         if mt != 0x03:  # only DEVICE_STATUS triggers entity updates
@@ -2259,13 +2520,10 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.relays[key] = event
 
         if event is not None:
-            self._last_event_time = time.monotonic()
-            for cb in self._event_callbacks:
-                try:
-                    cb(event)
-                except Exception:  # noqa: BLE001
-                    _LOGGER.exception("Error in CAN entity callback")
-            self.async_set_updated_data(self._build_data())
+            self._last_event_time = now = time.monotonic()
+            self._healthy_until = now + self._healthy_window
+            self._queue_event(event)
+            self._schedule_update()
 
     async def _send_can_device_discovery(self, client: BleakClient) -> None:
         """Broadcast a DEVICE_ID REQUEST to enumerate all devices on the IDS-CAN bus."""
@@ -2990,7 +3248,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Read UNLOCK_STATUS, compute 4-byte TEA key, write to KEY."""
         _LOGGER.debug("Step 1: reading UNLOCK_STATUS")
         try:
-            data = await client.read_gatt_char(UNLOCK_STATUS_CHAR_UUID)
+            data = await client.read_gatt_char(self._char(UNLOCK_STATUS_CHAR_UUID))
         except BleakError as exc:
             _LOGGER.warning("Step 1: failed to read UNLOCK_STATUS: %s", exc)
             return
@@ -3009,14 +3267,15 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Step 1: all-zeros challenge — gateway not ready")
             return
 
-        _LOGGER.debug("Step 1: challenge = %s", data.hex())
         key = calculate_step1_key(data)
-        _LOGGER.debug("Step 1: writing key = %s", key.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Step 1: challenge = %s", data.hex())
+            _LOGGER.debug("Step 1: writing key = %s", key.hex())
 
-        await client.write_gatt_char(KEY_CHAR_UUID, key, response=False)
+        await client.write_gatt_char(self._char(KEY_CHAR_UUID), key, response=False)
 
         await asyncio.sleep(UNLOCK_VERIFY_DELAY)
-        verify = await client.read_gatt_char(UNLOCK_STATUS_CHAR_UUID)
+        verify = await client.read_gatt_char(self._char(UNLOCK_STATUS_CHAR_UUID))
         verify_text = verify.decode("utf-8", errors="replace")
         if "unlocked" in verify_text.lower():
             _LOGGER.info("Step 1: gateway UNLOCKED")
@@ -3032,13 +3291,17 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _enable_notifications(self, client: BleakClient) -> None:
         """Subscribe to DATA_READ and SEED characteristics."""
         try:
-            await client.start_notify(DATA_READ_CHAR_UUID, self._on_data_read)
+            await client.start_notify(
+                self._char(DATA_READ_CHAR_UUID), self._on_data_read
+            )
             _LOGGER.debug("Subscribed to DATA_READ (0x0034)")
         except BleakError as exc:
             _LOGGER.warning("Failed to subscribe DATA_READ: %s", exc)
 
         try:
-            await client.start_notify(SEED_CHAR_UUID, self._on_seed_notification)
+            await client.start_notify(
+                self._char(SEED_CHAR_UUID), self._on_seed_notification
+            )
             _LOGGER.debug("Subscribed to SEED (0x0011)")
         except BleakError as exc:
             _LOGGER.warning("Failed to subscribe SEED: %s", exc)
@@ -3068,8 +3331,10 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self, characteristic: BleakGATTCharacteristic, data: bytearray
     ) -> None:
         """Handle SEED notification — schedule Step 2 auth."""
-        _LOGGER.debug("Step 2: SEED notification = %s", bytes(data).hex())
-        self.hass.async_create_task(self._authenticate_step2(bytes(data)))
+        seed = bytes(data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Step 2: SEED notification = %s", seed.hex())
+        self.hass.async_create_task(self._authenticate_step2(seed))
 
     async def _authenticate_step2(self, seed: bytes) -> None:
         """Compute 16-byte auth key and write to KEY characteristic."""
@@ -3078,14 +3343,15 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         key = calculate_step2_key(seed, self.gateway_pin)
-        _LOGGER.debug("Step 2: writing auth key = %s", key.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Step 2: writing auth key = %s", key.hex())
 
         if self._client is None:
             _LOGGER.warning("Step 2: no BLE client")
             return
 
         try:
-            await self._client.write_gatt_char(KEY_CHAR_UUID, key, response=False)
+            await self._client.write_gatt_char(self._char(KEY_CHAR_UUID), key, response=False)
             _LOGGER.info("Step 2: auth key written — authentication complete")
             self._authenticated = True
             self.async_set_updated_data(self._build_data())
@@ -3101,6 +3367,10 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         cmd = self._cmd.build_get_devices_metadata(table_id)
         cmd_id = int.from_bytes(cmd[0:2], "little")
         self._pending_metadata_cmdids[cmd_id] = table_id
+        if len(self._pending_metadata_cmdids) > _MAX_PENDING_METADATA_CMDIDS:
+            stale = next(iter(self._pending_metadata_cmdids))
+            self._pending_metadata_cmdids.pop(stale)
+            self._pending_metadata_entries.pop(stale, None)
         self._pending_metadata_entries.pop(cmd_id, None)
         self._metadata_requested_tables.add(table_id)
         try:
@@ -3207,7 +3477,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         await self._send_metadata_request(table_id)
 
     def _ensure_metadata_for_table(self, table_id: int) -> None:
-        """Request metadata for an observed table_id if not yet requested/loaded/rejected.
+        """Request metadata for an observed table_id if not yet requested or loaded.
 
         Implements the observed-table path: any status event carrying a table_id
         triggers a metadata request for that table if we haven't already loaded or
@@ -3215,6 +3485,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         if table_id == 0:
             return
+        self._tables_seen.add(table_id)
         if (
             table_id in self._metadata_loaded_tables
             or table_id in self._metadata_requested_tables
@@ -3234,6 +3505,16 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             return
         _LOGGER.debug("Requesting metadata for observed table_id=%d", table_id)
+        self._queue_metadata_request(table_id)
+
+    def _queue_metadata_request(self, table_id: int) -> None:
+        """Spawn a metadata request, marking the table requested immediately.
+
+        Marking before the task runs coalesces the burst of status frames (and
+        heartbeat GetDevices completions) that arrive for the same table before
+        the first request is written, so each table costs one BLE write.
+        """
+        self._metadata_requested_tables.add(table_id)
         self.hass.async_create_task(self._send_metadata_request(table_id))
 
     # ------------------------------------------------------------------
@@ -3309,18 +3590,25 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self, characteristic: BleakGATTCharacteristic, data: bytearray
     ) -> None:
         """Receive raw bytes from DATA_READ, feed through COBS decoder."""
-        for byte_val in data:
-            frame = self._decoder.decode_byte(byte_val)
-            if frame is not None:
-                self._process_frame(frame)
+        # Decoding stays on the event loop: the decoder is pure Python (no GIL
+        # release to gain from a worker thread) and every frame mutates
+        # coordinator state that is only safe to touch from the loop.
+        frames = self._decoder.feed(data)
+        if not frames:
+            return
+        # One clock read per notification, shared by every frame in it
+        now = time.monotonic()
+        for frame in frames:
+            self._process_frame(frame, now)
 
-    def _process_frame(self, frame: bytes) -> None:
+    def _process_frame(self, frame: bytes, now: float) -> None:
         """Parse a decoded COBS frame and update coordinator state."""
         if not frame:
             return
 
         # Track data freshness
-        self._last_event_time = time.monotonic()
+        self._last_event_time = now
+        self._healthy_until = now + self._healthy_window
 
         event_type = frame[0]
 
@@ -3328,11 +3616,11 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # responseType byte 3: 0x01=SuccessMulti, 0x81=SuccessComplete, 0x02/0x82=Fail
         # Reference: METADATA_RETRIEVAL.md § Response Format; MyRvLinkCommandGetDevicesMetadata.cs
         if event_type == 0x02 and len(frame) >= 4:
-            response_type = frame[3] & 0xFF
+            response_type = frame[3]
+            cmd_id = _U16_LE.unpack_from(frame, 1)[0]
             if response_type == 0x81:
                 # SuccessComplete: final frame carrying DeviceMetadataTableCrc (bytes 4–7 LE)
                 # and total device count (byte 8). Validate CRC against GatewayInformation.
-                cmd_id = (frame[1] & 0xFF) | ((frame[2] & 0xFF) << 8)
                 completed_get_devices_table = self._pending_get_devices_cmdids.pop(cmd_id, None)
                 if completed_get_devices_table is not None:
                     self._cmd_correlation_stats["get_devices_completed"] += 1
@@ -3355,15 +3643,13 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             "Scheduling metadata request after GetDevices completion for table %d",
                             completed_get_devices_table,
                         )
-                        self.hass.async_create_task(
-                            self._send_metadata_request(completed_get_devices_table)
-                        )
+                        self._queue_metadata_request(completed_get_devices_table)
                     return
                 completed_table = self._pending_metadata_cmdids.pop(cmd_id, None)
                 if completed_table is not None and len(frame) >= 8:
                     # CRC is big-endian per MyRvLinkCommandGetDevicesMetadataResponseCompleted.cs
                     # (GetValueUInt32 defaults to Endian.Big in ArrayExtension.cs)
-                    response_crc = int.from_bytes(frame[4:8], "big")
+                    response_crc = _U32_BE.unpack_from(frame, 4)[0]
                     response_count = frame[8] & 0xFF if len(frame) >= 9 else None
                     staged_entries = self._pending_metadata_entries.pop(cmd_id, {})
                     staged_count = len(staged_entries)
@@ -3413,7 +3699,6 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         )
                 return
             if response_type == 0x82:
-                cmd_id = (frame[1] & 0xFF) | ((frame[2] & 0xFF) << 8)
                 rejected_table = self._pending_metadata_cmdids.pop(cmd_id, None)
                 self._pending_metadata_entries.pop(cmd_id, None)
                 if rejected_table is not None:
@@ -3485,8 +3770,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # response_type=0x01; the ONLY distinguisher is the cmdId in bytes 1-2.
             # Without this gate, GetDevices device-row frames (payloadSize=10) are
             # incorrectly passed to parse_metadata_response and silently skipped.
-            if response_type == 0x01 and len(frame) >= 3:
-                cmd_id = (frame[1] & 0xFF) | ((frame[2] & 0xFF) << 8)
+            if response_type == 0x01:
                 if cmd_id not in self._pending_metadata_cmdids:
                     if cmd_id in self._pending_get_devices_cmdids:
                         self._cmd_correlation_stats[
@@ -3521,202 +3805,186 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self._cmd_correlation_stats["metadata_entries_staged"] += added
                 return
 
-        event = parse_event(frame)
-        _LOGGER.debug(
-            "Event 0x%02X (%d bytes): %s",
-            event_type,
-            len(frame),
-            type(event).__name__ if not isinstance(event, (bytes, bytearray, type(None))) else "raw",
-        )
-
-        # ── Update accumulated state ──────────────────────────────────
-        if isinstance(event, GatewayInformation):
-            _LOGGER.debug(
-                "GatewayInfo: table_id=%d, devices=%d, "
-                "table_crc=0x%08x, metadata_crc=0x%08x",
-                event.table_id,
-                event.device_count,
-                event.device_table_crc,
-                event.device_metadata_table_crc,
-            )
+        if event_type not in PARSED_EVENT_TYPES:
+            # Session heartbeat or unknown type: no handler or entity
+            # consumes it, so skip parsing, callbacks and the state update.
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Event 0x%02X (%d bytes): raw", event_type, len(frame))
+            return
 
-            # CRC-gated metadata logic (mirrors official app DeviceMetadataTracker):
-            # If the gateway reports the same DeviceMetadataTableCrc we last loaded,
-            # the metadata in _metadata_raw is still valid — restore tracking state
-            # and skip the BLE request entirely.
-            # If the CRC has changed, invalidate cached metadata for this table so
-            # a fresh request is triggered (e.g. after a gateway firmware update).
-            crc = event.device_metadata_table_crc
-            if crc != 0 and crc == self._last_metadata_crc:
-                self._metadata_loaded_tables.add(event.table_id)
-                _LOGGER.debug(
-                    "Metadata CRC unchanged (0x%08x), skipping re-request for table %d",
-                    crc,
-                    event.table_id,
-                )
-            elif (
-                self._last_metadata_crc is not None
-                and crc != self._last_metadata_crc
-                and event.table_id in self._metadata_loaded_tables
-            ):
-                _LOGGER.info(
-                    "Metadata CRC changed (0x%08x → 0x%08x), invalidating table %d",
-                    self._last_metadata_crc,
-                    crc,
-                    event.table_id,
-                )
-                self._last_metadata_crc = None
-                prefix = f"{event.table_id:02x}:"
-                for k in list(self._metadata_raw):
-                    if k.startswith(prefix):
-                        del self._metadata_raw[k]
-                        self.device_names.pop(k, None)
-                self._metadata_requested_tables.discard(event.table_id)
-                self._metadata_loaded_tables.discard(event.table_id)
-                self._metadata_rejected_tables.discard(event.table_id)
-
-            self.gateway_info = event
-
-            self._ensure_startup_bootstrap(event.table_id)
-
-        elif isinstance(event, RvStatus):
-            self.rv_status = event
+        event = parse_event(frame)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "RvStatus: voltage=%s V, temp=%s °F",
-                f"{event.voltage:.2f}" if event.voltage is not None else "N/A",
-                f"{event.temperature:.1f}" if event.temperature is not None else "N/A",
+                "Event 0x%02X (%d bytes): %s",
+                event_type,
+                len(frame),
+                type(event).__name__ if not isinstance(event, (bytes, bytearray, type(None))) else "raw",
             )
 
-        elif isinstance(event, RelayStatus):
-            key = _device_key(event.table_id, event.device_id)
-            self.relays[key] = event
-            self._ensure_metadata_for_table(event.table_id)
-            # Fire HA event for DTC faults (only on change, gas appliances only)
-            # Android behaviour: only publish DTC for devices with "gas" in name
-            prev_dtc = self._last_dtc_codes.get(key, 0)
-            self._last_dtc_codes[key] = event.dtc_code
-            if event.dtc_code != prev_dtc and event.dtc_code and dtc_is_fault(event.dtc_code):
-                device_name = self.device_name(event.table_id, event.device_id)
-                dtc_name = dtc_get_name(event.dtc_code)
-                is_gas = "gas" in device_name.lower()
-                if is_gas:
-                    _LOGGER.warning(
-                        "DTC fault on %s: code=%d (%s)",
-                        device_name, event.dtc_code, dtc_name,
-                    )
-                    self.hass.bus.async_fire(
-                        "onecontrol_dtc_fault",
-                        {
-                            "device_key": key,
-                            "device_name": device_name,
-                            "dtc_code": event.dtc_code,
-                            "dtc_name": dtc_name,
-                            "table_id": event.table_id,
-                            "device_id": event.device_id,
-                        },
-                    )
-                else:
-                    _LOGGER.debug(
-                        "DTC on %s (non-gas, ignored): code=%d (%s)",
-                        device_name, event.dtc_code, dtc_name,
-                    )
-
-        elif isinstance(event, DimmableLight):
-            key = _device_key(event.table_id, event.device_id)
-            self.dimmable_lights[key] = event
-            if event.brightness > 0:
-                self._last_known_dimmable_brightness[key] = event.brightness
-            self._ensure_metadata_for_table(event.table_id)
-
-        elif isinstance(event, RgbLight):
-            key = _device_key(event.table_id, event.device_id)
-            self.rgb_lights[key] = event
-            # Only persist non-zero color — mirrors Android lastKnownRgbColor update guard.
-            if event.is_on:
-                self._last_known_rgb_color[key] = (event.red, event.green, event.blue)
-            self._ensure_metadata_for_table(event.table_id)
-
-        elif isinstance(event, CoverStatus):
-            key = _device_key(event.table_id, event.device_id)
-            self.covers[key] = event
-            self._ensure_metadata_for_table(event.table_id)
-
-        elif isinstance(event, list):
+        # ── Update accumulated state ──────────────────────────────────
+        handlers = self._event_handlers
+        if isinstance(event, list):
             # Multi-item events: HvacZone list, TankLevel list, DeviceMetadata list
             for item in event:
-                if isinstance(item, HvacZone):
-                    self._handle_hvac_zone(item)
-                elif isinstance(item, TankLevel):
-                    key = _device_key(item.table_id, item.device_id)
-                    self.tanks[key] = item
-                    self._ensure_metadata_for_table(item.table_id)
-                elif isinstance(item, DeviceMetadata):
-                    self._process_metadata(item)
-
-        elif isinstance(event, TankLevel):
-            key = _device_key(event.table_id, event.device_id)
-            self.tanks[key] = event
-            self._ensure_metadata_for_table(event.table_id)
-
-        elif isinstance(event, HvacZone):
-            self._handle_hvac_zone(event)
-
-        elif isinstance(event, DeviceOnline):
-            key = _device_key(event.table_id, event.device_id)
-            self.device_online[key] = event
-            self._ensure_metadata_for_table(event.table_id)
-
-        elif isinstance(event, SystemLockout):
-            self.system_lockout_level = event.lockout_level
-            _LOGGER.debug(
-                "SystemLockout: level=%d table=%d devices=%d",
-                event.lockout_level, event.table_id, event.device_count,
-            )
+                handler = handlers.get(type(item))
+                if handler is not None:
+                    handler(item, now)
+        else:
+            handler = handlers.get(type(event))
+            if handler is not None:
+                handler(event, now)
 
-        elif isinstance(event, DeviceLock):
-            key = _device_key(event.table_id, event.device_id)
-            self.device_locks[key] = event
-            self._ensure_metadata_for_table(event.table_id)
+        # ── Notify entity callbacks ───────────────────────────────────
+        self._queue_event(event)
 
-        elif isinstance(event, GeneratorStatus):
-            key = _device_key(event.table_id, event.device_id)
-            self.generators[key] = event
-            self._ensure_metadata_for_table(event.table_id)
+        # ── Trigger HA state update (coalesced across the burst) ─────
+        self._schedule_update()
 
-        elif isinstance(event, HourMeter):
-            key = _device_key(event.table_id, event.device_id)
-            self.hour_meters[key] = event
-            self._ensure_metadata_for_table(event.table_id)
+    def _store_device_event(self, store: dict[str, Any], event: Any, _now: float) -> None:
+        """Store a per-device status event and make sure its table has metadata."""
+        store[_device_key(event.table_id, event.device_id)] = event
+        self._ensure_metadata_for_table(event.table_id)
 
-        elif isinstance(event, LevelerStatus):
-            key = _device_key(event.table_id, event.device_id)
-            self.levelers[key] = event
-            self._ensure_metadata_for_table(event.table_id)
+    def _handle_gateway_info(self, event: GatewayInformation, _now: float) -> None:
+        """Apply GatewayInformation: CRC-gated metadata reuse and startup bootstrap."""
+        _LOGGER.debug(
+            "GatewayInfo: table_id=%d, devices=%d, "
+            "table_crc=0x%08x, metadata_crc=0x%08x",
+            event.table_id,
+            event.device_count,
+            event.device_table_crc,
+            event.device_metadata_table_crc,
+        )
 
-        elif isinstance(event, TankAlert):
-            key = _device_key(event.table_id, event.device_id)
-            self.tank_alerts[key] = event
-            self._ensure_metadata_for_table(event.table_id)
+        # CRC-gated metadata logic (mirrors official app DeviceMetadataTracker):
+        # If the gateway reports the same DeviceMetadataTableCrc we last loaded,
+        # the metadata in _metadata_raw is still valid — restore tracking state
+        # and skip the BLE request entirely.
+        # If the CRC has changed, invalidate cached metadata for this table so
+        # a fresh request is triggered (e.g. after a gateway firmware update).
+        crc = event.device_metadata_table_crc
+        if crc != 0 and crc == self._last_metadata_crc:
+            self._metadata_loaded_tables.add(event.table_id)
+            _LOGGER.debug(
+                "Metadata CRC unchanged (0x%08x), skipping re-request for table %d",
+                crc,
+                event.table_id,
+            )
+        elif (
+            self._last_metadata_crc is not None
+            and crc != self._last_metadata_crc
+            and event.table_id in self._metadata_loaded_tables
+        ):
+            _LOGGER.info(
+                "Metadata CRC changed (0x%08x → 0x%08x), invalidating table %d",
+                self._last_metadata_crc,
+                crc,
+                event.table_id,
+            )
+            self._last_metadata_crc = None
+            for k in self._metadata_keys_by_table.pop(event.table_id, ()):
+                self._metadata_raw.pop(k, None)
+                if self.device_names.pop(k, None) is not None:
+                    self.device_names_version += 1
+                self._is_gas_device.pop(k, None)
+            self._metadata_requested_tables.discard(event.table_id)
+            self._metadata_loaded_tables.discard(event.table_id)
+
+        self._set_gateway_info(event)
+
+        self._ensure_startup_bootstrap(event.table_id)
+
+    def _handle_rv_status(self, event: RvStatus, _now: float) -> None:
+        """Store the latest RvStatus (system voltage / temperature)."""
+        self.rv_status = event
+        self._data["voltage"] = event.voltage
+        self._data["temperature"] = event.temperature
+        _LOGGER.debug(
+            "RvStatus: voltage=%s V, temp=%s °F",
+            f"{event.voltage:.2f}" if event.voltage is not None else "N/A",
+            f"{event.temperature:.1f}" if event.temperature is not None else "N/A",
+        )
 
-        elif isinstance(event, RealTimeClock):
-            self.rtc = event
+    def _handle_relay_status(self, event: RelayStatus, _now: float) -> None:
+        """Store a RelayStatus and fire onecontrol_dtc_fault on new gas-appliance faults."""
+        key = _device_key(event.table_id, event.device_id)
+        self.relays[key] = event
+        self._ensure_metadata_for_table(event.table_id)
+        # Fire HA event for DTC faults (only on change, gas appliances only)
+        # Android behaviour: only publish DTC for devices with "gas" in name
+        prev_dtc = self._last_dtc_codes.get(key, 0)
+        self._last_dtc_codes[key] = event.dtc_code
+        if event.dtc_code != prev_dtc and event.dtc_code and dtc_is_fault(event.dtc_code):
+            device_name = self.device_name(event.table_id, event.device_id)
+            dtc_name = dtc_get_name(event.dtc_code)
+            is_gas = self._is_gas_device.get(key)
+            if is_gas is None:  # name not resolved from metadata yet
+                is_gas = "gas" in device_name.lower()
+            if is_gas:
+                _LOGGER.warning(
+                    "DTC fault on %s: code=%d (%s)",
+                    device_name, event.dtc_code, dtc_name,
+                )
+                self.hass.bus.async_fire(
+                    "onecontrol_dtc_fault",
+                    {
+                        "device_key": key,
+                        "device_name": device_name,
+                        "dtc_code": event.dtc_code,
+                        "dtc_name": dtc_name,
+                        "table_id": event.table_id,
+                        "device_id": event.device_id,
+                    },
+                )
+            else:
+                _LOGGER.debug(
+                    "DTC on %s (non-gas, ignored): code=%d (%s)",
+                    device_name, event.dtc_code, dtc_name,
+                )
 
-        # ── Notify entity callbacks ───────────────────────────────────
-        for cb in self._event_callbacks:
-            try:
-                cb(event)
-            except Exception:  # noqa: BLE001
-                _LOGGER.exception("Error in event callback")
+    def _handle_dimmable_light(self, event: DimmableLight, _now: float) -> None:
+        """Store a DimmableLight, remembering the last non-zero brightness."""
+        key = _device_key(event.table_id, event.device_id)
+        self.dimmable_lights[key] = event
+        if event.brightness > 0:
+            self._last_known_dimmable_brightness[key] = event.brightness
+        self._ensure_metadata_for_table(event.table_id)
+
+    def _handle_rgb_light(self, event: RgbLight, _now: float) -> None:
+        """Store an RgbLight, remembering the last colour while on."""
+        key = _device_key(event.table_id, event.device_id)
+        self.rgb_lights[key] = event
+        # Only persist non-zero color — mirrors Android lastKnownRgbColor update guard.
+        if event.is_on:
+            self._last_known_rgb_color[key] = (event.red, event.green, event.blue)
+        self._ensure_metadata_for_table(event.table_id)
+
+    def _handle_system_lockout(self, event: SystemLockout, _now: float) -> None:
+        """Record the gateway's system lockout level."""
+        self.system_lockout_level = event.lockout_level
+        _LOGGER.debug(
+            "SystemLockout: level=%d table=%d devices=%d",
+            event.lockout_level, event.table_id, event.device_count,
+        )
 
-        # ── Trigger HA state update ───────────────────────────────────
-        self.async_set_updated_data(self._build_data())
+    def _handle_rtc(self, event: RealTimeClock, _now: float) -> None:
+        """Store the gateway real-time clock."""
+        self.rtc = event
+
+    def _handle_metadata(self, meta: DeviceMetadata, _now: float) -> None:
+        """Apply a DeviceMetadata entry delivered as a regular event."""
+        self._process_metadata(meta)
 
     def _process_metadata(self, meta: DeviceMetadata) -> None:
         """Store metadata and resolve friendly name."""
         key = _device_key(meta.table_id, meta.device_id)
         self._metadata_raw[key] = meta
+        self._metadata_keys_by_table.setdefault(meta.table_id, set()).add(key)
         name = get_friendly_name(meta.function_name, meta.function_instance)
-        self.device_names[key] = name
+        if self.device_names.get(key) != name:
+            self.device_names[key] = name
+            self.device_names_version += 1
+        self._is_gas_device[key] = "gas" in name.lower()
         self._metadata_loaded_tables.add(meta.table_id)
         # Record the CRC for the gateway's primary table so reconnects can skip
         # re-requesting metadata when the CRC hasn't changed.
@@ -3767,24 +4035,40 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 device_name,
                 meta.function_name,
             )
-            for cb in self._event_callbacks:
-                try:
-                    cb(stub)
-                except Exception:  # noqa: BLE001
-                    _LOGGER.exception("Error in event callback during device seed")
+            self._queue_event(stub)
+
+    def _schedule_update(self) -> None:
+        """Push a coordinator update at most once per UPDATE_COALESCE_DELAY.
+
+        Frames arrive in bursts (GetDevices responses, CAN broadcast cycles);
+        the first frame arms the flush and the rest ride along with it.
+        """
+        if self._update_handle is None:
+            self._update_handle = self.hass.loop.call_later(
+                UPDATE_COALESCE_DELAY, self._flush_update
+            )
+
+    @callback
+    def _flush_update(self) -> None:
+        """Deliver the coalesced update armed by _schedule_update."""
+        self._update_handle = None
+        self.async_set_updated_data(self._build_data())
+
+    def _set_gateway_info(self, info: GatewayInformation) -> None:
+        """Store gateway information and mirror it into the data dict."""
+        self.gateway_info = info
+        self._data["table_id"] = info.table_id
+        self._data["device_count"] = info.device_count
 
     def _build_data(self) -> dict[str, Any]:
-        """Build the coordinator data dict consumed by entities."""
-        data: dict[str, Any] = {
-            "connected": self._connected,
-            "authenticated": self._authenticated,
-        }
-        if self.rv_status:
-            data["voltage"] = self.rv_status.voltage
-            data["temperature"] = self.rv_status.temperature
-        if self.gateway_info:
-            data["table_id"] = self.gateway_info.table_id
-            data["device_count"] = self.gateway_info.device_count
+        """Return the coordinator data dict consumed by entities.
+
+        Voltage/temperature and table info are written by their event
+        handlers; only the connection flags are refreshed here.
+        """
+        data = self._data
+        data["connected"] = self._connected
+        data["authenticated"] = self._authenticated
         return data
 
     # ------------------------------------------------------------------
@@ -3801,7 +4085,6 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._decoder.reset()
         self._metadata_requested_tables.clear()
         self._metadata_loaded_tables.clear()
-        self._metadata_rejected_tables.clear()
         self._metadata_retry_counts.clear()
         self._metadata_retry_pending.clear()
         self._pending_metadata_cmdids.clear()
@@ -3813,6 +4096,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._unknown_command_counts.clear()
         self._initial_get_devices_sent = False
         self._has_can_write = False
+        self._gatt_chars = {}
         self._is_can_ble = False
         self._can_device_types = {}
         self._can_protocol_by_source.clear()
@@ -3837,11 +4121,15 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._pin_dbus_succeeded = False
         self._push_button_dbus_ok = False
         # PIN agent context is cleaned up inside _finish_connect; if somehow
-        # still set here, schedule async cleanup (callback is synchronous).
+        # still set here, clean up now.  Only unregistering the agent needs a
+        # D-Bus round-trip, so only that case is handed to a task.
         if self._pin_agent_ctx:
             ctx = self._pin_agent_ctx
             self._pin_agent_ctx = None
-            self.hass.async_create_task(ctx.cleanup())
+            if ctx.agent_registered:
+                self.hass.async_create_task(ctx.cleanup())
+            else:
+                ctx.close()
 
         self.async_set_updated_data(self._build_data())
 
@@ -3867,7 +4155,17 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         self._reconnect_generation += 1
         generation = self._reconnect_generation
-        
+        delay = self._next_reconnect_delay()
+        _LOGGER.debug(
+            "Scheduling reconnect in %.0fs (attempt %d, gen=%d, instance=%s)",
+            delay, self._consecutive_failures, generation, self._instance_tag,
+        )
+        self._reconnect_task = self.hass.async_create_task(
+            self._reconnect_with_delay(delay, generation)
+        )
+
+    def _next_reconnect_delay(self) -> float:
+        """Return the backoff before the next reconnect attempt and count it."""
         # For CAN BLE gateways, add extra delay on first reconnect to let BlueZ settle
         # after the disconnect. CAN BLE disconnects can leave BlueZ in "InProgress" state
         # if we reconnect too quickly.
@@ -3882,19 +4180,16 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 RECONNECT_BACKOFF_BASE * (2 ** self._consecutive_failures),
                 RECONNECT_BACKOFF_CAP,
             )
-        
         self._consecutive_failures += 1
-        _LOGGER.debug(
-            "Scheduling reconnect in %.0fs (attempt %d, gen=%d, instance=%s)",
-            delay, self._consecutive_failures, generation, self._instance_tag,
-        )
-        self._reconnect_task = self.hass.async_create_task(
-            self._reconnect_with_delay(delay, generation)
-        )
+        return delay
 
     async def _reconnect_with_delay(self, delay: float, generation: int) -> None:
-        """Wait then attempt reconnection."""
-        try:
+        """Wait then attempt reconnection, backing off until an attempt succeeds.
+
+        Failed attempts retry inside this task rather than scheduling a new one;
+        only a fresh disconnect (via _schedule_reconnect) replaces it.
+        """
+        while True:
             await asyncio.sleep(delay)
             if self._closed:
                 return
@@ -3924,7 +4219,19 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "Attempting reconnection to %s (gen=%d, instance=%s)...",
                 self.address, generation, self._instance_tag,
             )
-            await self.async_connect()
+            try:
+                await self.async_connect()
+            except Exception as exc:
+                _LOGGER.warning("Reconnect failed: %s", exc)
+                if self._closed:
+                    return
+                # Retry with increased backoff
+                delay = self._next_reconnect_delay()
+                _LOGGER.debug(
+                    "Retrying reconnect in %.0fs (attempt %d, gen=%d, instance=%s)",
+                    delay, self._consecutive_failures, generation, self._instance_tag,
+                )
+                continue
             # Reset backoff only when the connection is actually usable
             # (authenticated, or bonded for PIN gateways).  If async_connect
             # returned without raising but we're not authenticated, we consider
@@ -3938,12 +4245,7 @@ class OneControlCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "keeping backoff counter (%d)",
                     self.address, self._consecutive_failures,
                 )
-        except asyncio.CancelledError:
-            pass
-        except Exception as exc:
-            _LOGGER.warning("Reconnect failed: %s", exc)
-            # Schedule next attempt with increased backoff
-            self._schedule_reconnect()
+            return
 
     def _cancel_reconnect(self) -> None:
         """Cancel any pending reconnect task."""
@@ -25,7 +25,6 @@ from homeassistant.components.cover import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -45,21 +44,21 @@ async def async_setup_entry(
     coordinator: OneControlCoordinator = hass.data[DOMAIN][entry.entry_id]
     address = entry.data[CONF_ADDRESS]
 
-    discovered: set[str] = set()
+    discovered: set[tuple[int, int]] = set()
 
     @callback
-    def _on_event(event: Any) -> None:
-        if isinstance(event, CoverStatus):
-            key = f"{event.table_id:02x}:{event.device_id:02x}"
-            if key not in discovered:
-                discovered.add(key)
-                async_add_entities(
-                    [OneControlCover(coordinator, address, event.table_id, event.device_id)]
-                )
-
-    coordinator.register_event_callback(_on_event)
-
-    for key, cov in coordinator.covers.items():
+    def _on_cover(event: CoverStatus) -> None:
+        key = (event.table_id, event.device_id)
+        if key not in discovered:
+            discovered.add(key)
+            async_add_entities(
+                [OneControlCover(coordinator, address, event.table_id, event.device_id)]
+            )
+
+    entry.async_on_unload(coordinator.register_event_callback(_on_cover, CoverStatus))
+
+    for cov in coordinator.covers.values():
+        key = (cov.table_id, cov.device_id)
         if key not in discovered:
             discovered.add(key)
             async_add_entities(
@@ -89,16 +88,15 @@ class OneControlCover(CoordinatorEntity[OneControlCoordinator], CoverEntity):
         self._table_id = table_id
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
-        mac = address.replace(":", "").lower()
+        # Latest status for this cover, refreshed by _on_event so the state
+        # properties below don't each repeat the coordinator dict lookup.
+        self._cov: CoverStatus | None = coordinator.covers.get(self._key)
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_cover_{device_id:02x}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
+        self._attr_device_info = coordinator.device_info
+        self._unsub = coordinator.register_device_callback(
+            CoverStatus, table_id, device_id, self._on_event
         )
-        self._unsub = coordinator.register_event_callback(self._on_event)
 
     @property
     def name(self) -> str:
@@ -111,7 +109,7 @@ class OneControlCover(CoordinatorEntity[OneControlCoordinator], CoverEntity):
     @property
     def is_closed(self) -> bool | None:
         """Return True if the cover is fully closed (stopped, position 0 or unknown)."""
-        cov = self.coordinator.covers.get(self._key)
+        cov = self._cov
         if not cov:
             return None
         # If stopped and position is 0% → closed
@@ -125,25 +123,25 @@ class OneControlCover(CoordinatorEntity[OneControlCoordinator], CoverEntity):
 
     @property
     def is_opening(self) -> bool:
-        cov = self.coordinator.covers.get(self._key)
+        cov = self._cov
         return cov.ha_state == "opening" if cov else False
 
     @property
     def is_closing(self) -> bool:
-        cov = self.coordinator.covers.get(self._key)
+        cov = self._cov
         return cov.ha_state == "closing" if cov else False
 
     @property
     def current_cover_position(self) -> int | None:
         """Position 0-100, None if unknown."""
-        cov = self.coordinator.covers.get(self._key)
+        cov = self._cov
         if not cov or cov.position == 0xFF:
             return None
         return cov.position
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        cov = self.coordinator.covers.get(self._key)
+        cov = self._cov
         if not cov:
             return {}
         return {
@@ -168,10 +166,6 @@ class OneControlCover(CoordinatorEntity[OneControlCoordinator], CoverEntity):
         self._unsub()
 
     @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, CoverStatus)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
+    def _on_event(self, event: CoverStatus) -> None:
+        self._cov = event
+        self.async_write_ha_state()
@@ -23,7 +23,6 @@ from homeassistant.components.light import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -44,37 +43,39 @@ async def async_setup_entry(
     coordinator: OneControlCoordinator = hass.data[DOMAIN][entry.entry_id]
     address = entry.data[CONF_ADDRESS]
 
-    discovered: set[str] = set()
+    discovered: set[tuple[type, int, int]] = set()
 
     @callback
-    def _on_event(event: Any) -> None:
-        if isinstance(event, DimmableLight):
-            key = f"dim_{event.table_id:02x}:{event.device_id:02x}"
-            if key not in discovered:
-                discovered.add(key)
-                async_add_entities(
-                    [OneControlDimmableLight(coordinator, address, event.table_id, event.device_id)]
-                )
-        elif isinstance(event, RgbLight):
-            key = f"rgb_{event.table_id:02x}:{event.device_id:02x}"
-            if key not in discovered:
-                discovered.add(key)
-                async_add_entities(
-                    [OneControlRgbLight(coordinator, address, event.table_id, event.device_id)]
-                )
+    def _on_dimmable(event: DimmableLight) -> None:
+        key = (DimmableLight, event.table_id, event.device_id)
+        if key not in discovered:
+            discovered.add(key)
+            async_add_entities(
+                [OneControlDimmableLight(coordinator, address, event.table_id, event.device_id)]
+            )
 
-    coordinator.register_event_callback(_on_event)
+    @callback
+    def _on_rgb(event: RgbLight) -> None:
+        key = (RgbLight, event.table_id, event.device_id)
+        if key not in discovered:
+            discovered.add(key)
+            async_add_entities(
+                [OneControlRgbLight(coordinator, address, event.table_id, event.device_id)]
+            )
 
-    for key, light in coordinator.dimmable_lights.items():
-        disc_key = f"dim_{key}"
+    entry.async_on_unload(coordinator.register_event_callback(_on_dimmable, DimmableLight))
+    entry.async_on_unload(coordinator.register_event_callback(_on_rgb, RgbLight))
+
+    for light in coordinator.dimmable_lights.values():
+        disc_key = (DimmableLight, light.table_id, light.device_id)
         if disc_key not in discovered:
             discovered.add(disc_key)
             async_add_entities(
                 [OneControlDimmableLight(coordinator, address, light.table_id, light.device_id)]
             )
 
-    for key, light in coordinator.rgb_lights.items():
-        disc_key = f"rgb_{key}"
+    for light in coordinator.rgb_lights.values():
+        disc_key = (RgbLight, light.table_id, light.device_id)
         if disc_key not in discovered:
             discovered.add(disc_key)
             async_add_entities(
@@ -117,16 +118,12 @@ class OneControlDimmableLight(CoordinatorEntity[OneControlCoordinator], LightEnt
         self._table_id = table_id
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_light_{device_id:02x}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
+        self._attr_device_info = coordinator.device_info
+        self._unsub = coordinator.register_device_callback(
+            DimmableLight, table_id, device_id, self._on_event
         )
-        self._unsub = coordinator.register_event_callback(self._on_event)
 
     @property
     def name(self) -> str:
@@ -222,13 +219,8 @@ class OneControlDimmableLight(CoordinatorEntity[OneControlCoordinator], LightEnt
         self._unsub()
 
     @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, DimmableLight)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
+    def _on_event(self, _event: Any) -> None:
+        self.async_write_ha_state()
 
 
 # ── RGB Light Effect Names ──────────────────────────────────────────────────
@@ -264,16 +256,12 @@ class OneControlRgbLight(CoordinatorEntity[OneControlCoordinator], LightEntity):
         self._table_id = table_id
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_rgb_{device_id:02x}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
+        self._attr_device_info = coordinator.device_info
+        self._unsub = coordinator.register_device_callback(
+            RgbLight, table_id, device_id, self._on_event
         )
-        self._unsub = coordinator.register_event_callback(self._on_event)
 
     @property
     def name(self) -> str:
@@ -375,10 +363,5 @@ class OneControlRgbLight(CoordinatorEntity[OneControlCoordinator], LightEntity):
         self._unsub()
 
     @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, RgbLight)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
\ No newline at end of file
+    def _on_event(self, _event: Any) -> None:
+        self.async_write_ha_state()
\ No newline at end of file
@@ -4,7 +4,7 @@ The gateway uses COBS with CRC8 on the DATA_READ / DATA_WRITE characteristics.
 Frame structure on the wire: [0x00] <cobs-encoded payload + crc8> [0x00]
 
 This module provides:
-  - ``CobsByteDecoder``  — stateful byte-by-byte decoder (for BLE notifications)
+  - ``CobsByteDecoder``  — stateful streaming decoder (for BLE notifications)
   - ``cobs_encode``      — one-shot encoder (for building commands)
 """
 
@@ -18,144 +18,169 @@ FRAME_BYTE_COUNT_LSB = 64  # 2^6
 MAX_COMPRESSED_FRAME_BYTES = 192  # 255 - 63
 MAX_BUFFER = 382
 
+# Zero runs a code byte can carry in its top two bits (code >> 6)
+_ZERO_RUNS = (b"", b"\x00", b"\x00\x00", b"\x00\x00\x00")
+
 
 class CobsByteDecoder:
     """Stateful COBS byte-by-byte decoder with CRC8 verification.
 
     Feed each byte from a BLE notification through ``decode_byte()``.
     When a complete frame is received it returns the decoded payload;
-    otherwise it returns ``None``.
+    otherwise it returns ``None``.  ``feed()`` does the same for a whole
+    notification at once and returns every frame it completed.
     """
 
     def __init__(self, use_crc: bool = True) -> None:
         self._use_crc = use_crc
         self._min_payload = 1 if use_crc else 0
-        self._buf = bytearray(MAX_BUFFER)
+        # Slack for one decode_byte() step (a data byte plus up to three
+        # implicit zeros) past MAX_BUFFER, so writes need no bounds check.
+        self._buf = bytearray(MAX_BUFFER + 4)
         self._dst = 0
         self._code = 0
+        # Undelimited tail carried between feed() calls
+        self._pending = bytearray()
 
     def reset(self) -> None:
         self._dst = 0
         self._code = 0
+        self._pending.clear()
 
     def decode_byte(self, b: int) -> bytes | None:
-        """Process a single byte.  Returns decoded frame or None."""
-        b &= 0xFF
-
+        """Process a single byte (0..255).  Returns decoded frame or None."""
         if b == FRAME_CHAR:
             # Frame terminator
             if self._code != 0:
                 self.reset()
                 return None
-            if self._dst <= self._min_payload:
+            if self._dst <= self._min_payload or self._dst > MAX_BUFFER:
                 self.reset()
                 return None
 
+            payload = memoryview(self._buf)[: self._dst]
             if self._use_crc:
-                received_crc = self._buf[self._dst - 1]
-                self._dst -= 1
-                calculated = crc8(bytes(self._buf[: self._dst]))
-                if calculated != received_crc:
+                received_crc = payload[-1]
+                payload = payload[:-1]
+                if crc8(payload) != received_crc:
                     self.reset()
                     return None
 
-            result = bytes(self._buf[: self._dst])
+            result = bytes(payload)
             self.reset()
             return result
 
+        if self._dst > MAX_BUFFER:
+            return None  # overlong frame — rejected at its terminator
+
         if self._code <= 0:
             # Start of a new code block
             self._code = b
         else:
             self._code -= 1
-            if self._dst < MAX_BUFFER:
-                self._buf[self._dst] = b
-                self._dst += 1
+            self._buf[self._dst] = b
+            self._dst += 1
 
         # Insert implicit zeros when code block consumed
-        if (self._code & MAX_DATA_BYTES) == 0:
-            while self._code > 0:
-                if self._dst < MAX_BUFFER:
-                    self._buf[self._dst] = FRAME_CHAR
-                    self._dst += 1
-                self._code -= FRAME_BYTE_COUNT_LSB
+        code = self._code
+        if code and not code & MAX_DATA_BYTES:
+            zeros = code >> 6
+            self._buf[self._dst : self._dst + zeros] = _ZERO_RUNS[zeros]
+            self._dst += zeros
+            self._code = 0
 
         return None
 
+    def feed(self, data: bytes | bytearray) -> list[bytes]:
+        """Process a whole notification.  Returns the frames it completed.
+
+        Bytes are buffered until a frame terminator shows up (located with
+        ``bytearray.find``); each complete frame is then decoded one code
+        block at a time with slice copies instead of per-byte steps.
+        Use either ``feed()`` or ``decode_byte()`` on a given decoder, not both.
+        """
+        pending = self._pending
+        pending += data
+        frames: list[bytes] = []
+        start = 0
+        with memoryview(pending) as view:
+            while (end := pending.find(FRAME_CHAR, start)) != -1:
+                if end > start:
+                    frame = self._decode_frame(view[start:end])
+                    if frame is not None:
+                        frames.append(frame)
+                start = end + 1
+        if start:
+            del pending[:start]
+        if len(pending) > 2 * MAX_BUFFER:
+            # No terminator in far more than a maximum frame: line noise
+            pending.clear()
+        return frames
+
+    def _decode_frame(self, body: memoryview) -> bytes | None:
+        """Decode one frame body (between terminators) and verify its CRC."""
+        out = bytearray()
+        i = 0
+        n = len(body)
+        while i < n:
+            code = body[i]
+            i += 1
+            end = i + (code & MAX_DATA_BYTES)
+            if end > n:
+                return None  # truncated code block
+            out += body[i:end]
+            i = end
+            if code >= FRAME_BYTE_COUNT_LSB:
+                out += _ZERO_RUNS[code >> 6]  # compressed zeros
+
+        if len(out) <= self._min_payload or len(out) > MAX_BUFFER:
+            return None
+        if self._use_crc:
+            received_crc = out.pop()
+            if crc8(out) != received_crc:
+                return None
+        return bytes(out)
+
 
 def cobs_encode(data: bytes, prepend_start: bool = True, use_crc: bool = True) -> bytes:
     """COBS-encode *data* with optional start-frame byte and CRC8 suffix.
 
     Returns the wire-ready byte string including frame delimiters.
     """
-    out = bytearray(MAX_BUFFER)
-    idx = 0
+    out = bytearray()
 
     if prepend_start:
-        out[idx] = FRAME_CHAR
-        idx += 1
+        out.append(FRAME_CHAR)
 
     if not data:
-        out[idx] = FRAME_CHAR
-        idx += 1
-        return bytes(out[:idx])
+        out.append(FRAME_CHAR)
+        return bytes(out)
 
-    src_len = len(data)
-    total = src_len + (1 if use_crc else 0)
-    crc_val = 0x55  # CRC8 init
+    # The CRC covers the raw payload and is stuffed like any other byte
+    src = data + bytes((crc8(data),)) if use_crc else data
+    total = len(src)
     src_idx = 0
 
     while src_idx < total:
-        code_idx = idx
-        code = 0
-        out[idx] = 0xFF  # placeholder
-        idx += 1
-
-        # Non-zero data bytes
-        while src_idx < total:
-            if src_idx < src_len:
-                bval = data[src_idx]
-                if bval == FRAME_CHAR:
-                    break
-                crc_val = _crc_update(crc_val, bval)
-            else:
-                # CRC byte position
-                bval = crc_val & 0xFF
-                if bval == FRAME_CHAR:
-                    break
-
-            src_idx += 1
-            out[idx] = bval
-            idx += 1
-            code += 1
-
-            if code >= MAX_DATA_BYTES:
-                break
+        # Up to MAX_DATA_BYTES non-zero bytes, copied as one slice
+        end = min(src_idx + MAX_DATA_BYTES, total)
+        zero = src.find(FRAME_CHAR, src_idx, end)
+        if zero < 0:
+            zero = end
+        code_idx = len(out)
+        code = zero - src_idx
+        out.append(0)
+        out += src[src_idx:zero]
+        src_idx = zero
 
         # Handle consecutive zeros (compressed)
-        while src_idx < total:
-            bval = data[src_idx] if src_idx < src_len else (crc_val & 0xFF)
-            if bval != FRAME_CHAR:
-                break
-            if src_idx < src_len:
-                crc_val = _crc_update(crc_val, FRAME_CHAR)
+        while src_idx < total and src[src_idx] == FRAME_CHAR:
             src_idx += 1
             code += FRAME_BYTE_COUNT_LSB
             if code >= MAX_COMPRESSED_FRAME_BYTES:
                 break
 
-        out[code_idx] = code & 0xFF
-
-    out[idx] = FRAME_CHAR
-    idx += 1
-    return bytes(out[:idx])
-
-
-# ── CRC helper ────────────────────────────────────────────────────────────
-
-# Import table from crc8 module for one-byte update
-from .crc8 import _TABLE as _CRC_TABLE  # noqa: E402
-
+        out[code_idx] = code
 
-def _crc_update(crc: int, b: int) -> int:
-    return _CRC_TABLE[(crc ^ b) & 0xFF]
+    out.append(FRAME_CHAR)
+    return bytes(out)
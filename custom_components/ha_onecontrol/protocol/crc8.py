@@ -42,7 +42,7 @@ _TABLE: bytes = bytes([
 RESET_VALUE = 0x55
 
 
-def crc8(data: bytes | bytearray, init: int = RESET_VALUE) -> int:
+def crc8(data: bytes | bytearray | memoryview, init: int = RESET_VALUE) -> int:
     """Compute CRC8 over *data* starting from *init* (default 0x55)."""
     crc = init & 0xFF
     for b in data:
@@ -1948,4 +1948,7 @@ def is_fault(code: int) -> bool:
 
 def get_name(code: int) -> str:
     """Return human-readable name for a DTC code."""
-    return DTC_CODES.get(code, f"UNKNOWN_DTC_{code}")
+    name = DTC_CODES.get(code)
+    if name is None:
+        return f"UNKNOWN_DTC_{code}"
+    return name
@@ -187,7 +187,7 @@ class RgbLight:
         return self.mode > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HvacZone:
     """HVAC zone status (event 0x0B).
 
@@ -769,6 +769,31 @@ def parse_metadata_response(data: bytes) -> list[DeviceMetadata]:
 # ── Dispatcher ────────────────────────────────────────────────────────────
 
 
+# Event types parse_event() decodes into dataclasses (or lists of them).
+# Anything else is a session heartbeat or an unknown type.
+PARSED_EVENT_TYPES: frozenset[int] = frozenset({
+    EVENT_GATEWAY_INFORMATION,
+    EVENT_RV_STATUS,
+    EVENT_RELAY_BASIC_LATCHING_1,
+    EVENT_RELAY_BASIC_LATCHING_2,
+    EVENT_DEVICE_ONLINE_STATUS,
+    EVENT_DEVICE_LOCK_STATUS,
+    EVENT_TANK_SENSOR,
+    EVENT_TANK_SENSOR_V2,
+    EVENT_TANK_ALERT,
+    EVENT_DIMMABLE_LIGHT,
+    EVENT_RGB_LIGHT,
+    EVENT_GENERATOR_GENIE,
+    EVENT_HVAC_STATUS,
+    EVENT_HBRIDGE_1,
+    EVENT_HBRIDGE_2,
+    EVENT_HOUR_METER,
+    EVENT_LEVELER,
+    EVENT_REAL_TIME_CLOCK,
+    EVENT_DEVICE_COMMAND,
+})
+
+
 def parse_event(data: bytes) -> Any:
     """Dispatch a decoded COBS frame to the appropriate parser.
 
@@ -52,16 +52,21 @@ X180T_KEY_SEED_CIPHER = 0xC81D7F20
 del _u, _M, _B, _b64d  # Clean up namespace
 
 
+# Running round sum for each round: delta, 2·delta, … (mod 2^32)
+_ROUND_SUMS: tuple[int, ...] = tuple(
+    (TEA_DELTA * (i + 1)) & MASK32 for i in range(TEA_ROUNDS)
+)
+
+
 def tea_encrypt(cipher: int, seed: int) -> int:
     """Run 32-round TEA encrypt.  All values are unsigned 32-bit."""
     c = cipher & MASK32
     s = seed & MASK32
-    delta = TEA_DELTA
+    k1, k2, k3, k4 = TEA_CONSTANT_1, TEA_CONSTANT_2, TEA_CONSTANT_3, TEA_CONSTANT_4
 
-    for _ in range(TEA_ROUNDS):
-        s = (s + (((c << 4) + TEA_CONSTANT_1) ^ (c + delta) ^ ((c >> 5) + TEA_CONSTANT_2))) & MASK32
-        c = (c + (((s << 4) + TEA_CONSTANT_3) ^ (s + delta) ^ ((s >> 5) + TEA_CONSTANT_4))) & MASK32
-        delta = (delta + TEA_DELTA) & MASK32
+    for delta in _ROUND_SUMS:
+        s = (s + (((c << 4) + k1) ^ (c + delta) ^ ((c >> 5) + k2))) & MASK32
+        c = (c + (((s << 4) + k3) ^ (s + delta) ^ ((s >> 5) + k4))) & MASK32
 
     return s
 
@@ -70,12 +75,11 @@ def tea_decrypt(cipher: int, encrypted: int) -> int:
     """Run 32-round TEA decrypt."""
     c = cipher & MASK32
     s = encrypted & MASK32
-    delta = (TEA_DELTA * TEA_ROUNDS) & MASK32
+    k1, k2, k3, k4 = TEA_CONSTANT_1, TEA_CONSTANT_2, TEA_CONSTANT_3, TEA_CONSTANT_4
 
-    for _ in range(TEA_ROUNDS):
-        c = (c - (((s << 4) + TEA_CONSTANT_3) ^ (s + delta) ^ ((s >> 5) + TEA_CONSTANT_4))) & MASK32
-        s = (s - (((c << 4) + TEA_CONSTANT_1) ^ (c + delta) ^ ((c >> 5) + TEA_CONSTANT_2))) & MASK32
-        delta = (delta - TEA_DELTA) & MASK32
+    for delta in reversed(_ROUND_SUMS):
+        c = (c - (((s << 4) + k3) ^ (s + delta) ^ ((s >> 5) + k4))) & MASK32
+        s = (s - (((c << 4) + k1) ^ (c + delta) ^ ((c >> 5) + k2))) & MASK32
 
     return s
 
@@ -83,7 +87,7 @@ def tea_decrypt(cipher: int, encrypted: int) -> int:
 # ── Step 1 ────────────────────────────────────────────────────────────────
 
 
-def calculate_step1_key(challenge_bytes: bytes) -> bytes:
+def calculate_step1_key(challenge_bytes: bytes | bytearray | memoryview) -> bytes:
     """Compute the 4-byte BIG-ENDIAN key for Step 1 (Data Service auth).
 
     *challenge_bytes* is the raw 4- byte value read from UNLOCK_STATUS.
@@ -96,7 +100,9 @@ def calculate_step1_key(challenge_bytes: bytes) -> bytes:
     return struct.pack(">I", encrypted & MASK32)  # BIG-ENDIAN result
 
 
-def calculate_can_ble_key_seed_key(seed_bytes: bytes, cipher: int = CAN_BLE_KEY_SEED_CIPHER) -> bytes:
+def calculate_can_ble_key_seed_key(
+    seed_bytes: bytes | bytearray | memoryview, cipher: int = CAN_BLE_KEY_SEED_CIPHER
+) -> bytes:
     """Compute the 4-byte BIG-ENDIAN key for CAN-BLE gateway key/seed unlock."""
     if len(seed_bytes) != 4:
         raise ValueError(f"CAN-BLE key/seed challenge must be 4 bytes, got {len(seed_bytes)}")
@@ -109,7 +115,7 @@ def calculate_can_ble_key_seed_key(seed_bytes: bytes, cipher: int = CAN_BLE_KEY_
 # ── Step 2 ────────────────────────────────────────────────────────────────
 
 
-def calculate_step2_key(seed_bytes: bytes, pin: str) -> bytes:
+def calculate_step2_key(seed_bytes: bytes | bytearray | memoryview, pin: str) -> bytes:
     """Compute the 16-byte key for Step 2 (Auth Service auth).
 
     *seed_bytes* is the 4-byte SEED notification from the gateway.
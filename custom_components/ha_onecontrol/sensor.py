@@ -34,7 +34,6 @@ from homeassistant.const import (
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -65,94 +64,60 @@ async def async_setup_entry(
         OneControlProtocolVersionSensor(coordinator, address),
     ]
 
-    discovered_tanks: set[str] = set()
-    discovered_generators: set[str] = set()
-    discovered_hour_meters: set[str] = set()
-    discovered_covers: set[str] = set()
-    discovered_levelers: set[str] = set()
-    discovered_tank_alerts: set[str] = set()
+    # Per-device sensors to create for each status event type, with the
+    # coordinator store that already holds devices seen before setup
+    specs: dict[type, tuple[dict[str, Any], tuple[type[SensorEntity], ...]]] = {
+        TankLevel: (coordinator.tanks, (OneControlTankSensor,)),
+        GeneratorStatus: (
+            coordinator.generators,
+            (
+                OneControlGeneratorSensor,
+                OneControlGeneratorBatterySensor,
+                OneControlGeneratorTemperatureSensor,
+            ),
+        ),
+        HourMeter: (coordinator.hour_meters, (OneControlHourMeterSensor,)),
+        CoverStatus: (coordinator.covers, (OneControlCoverStateSensor,)),
+        LevelerStatus: (coordinator.levelers, (OneControlLevelerPositionSensor,)),
+        TankAlert: (coordinator.tank_alerts, (OneControlTankAlertSensor,)),
+    }
+    discovered: set[tuple[type, int, int]] = set()
+
+    def _new_entities(item: Any) -> list[SensorEntity]:
+        event_type = type(item)
+        key = (event_type, item.table_id, item.device_id)
+        if key in discovered:
+            return []
+        discovered.add(key)
+        return [
+            cls(coordinator, address, item.table_id, item.device_id)
+            for cls in specs[event_type][1]
+        ]
+
+    # A fresh gateway reports its whole device table in one event burst;
+    # collect the new entities and add them in a single batch afterwards.
+    pending: list[SensorEntity] = []
+
+    @callback
+    def _add_pending() -> None:
+        batch = pending.copy()
+        pending.clear()
+        async_add_entities(batch)
 
     @callback
-    def _on_event(event: Any) -> None:
+    def _on_item(item: Any) -> None:
         """Dynamically add sensor entities as new devices appear."""
-        new: list[SensorEntity] = []
-
-        items = event if isinstance(event, list) else [event]
-        for item in items:
-            if isinstance(item, TankLevel):
-                key = f"{item.table_id:02x}:{item.device_id:02x}"
-                if key not in discovered_tanks:
-                    discovered_tanks.add(key)
-                    new.append(OneControlTankSensor(coordinator, address, item.table_id, item.device_id))
-
-            elif isinstance(item, GeneratorStatus):
-                key = f"{item.table_id:02x}:{item.device_id:02x}"
-                if key not in discovered_generators:
-                    discovered_generators.add(key)
-                    new.extend([
-                        OneControlGeneratorSensor(coordinator, address, item.table_id, item.device_id),
-                        OneControlGeneratorBatterySensor(coordinator, address, item.table_id, item.device_id),
-                        OneControlGeneratorTemperatureSensor(coordinator, address, item.table_id, item.device_id),
-                    ])
-
-            elif isinstance(item, HourMeter):
-                key = f"{item.table_id:02x}:{item.device_id:02x}"
-                if key not in discovered_hour_meters:
-                    discovered_hour_meters.add(key)
-                    new.append(OneControlHourMeterSensor(coordinator, address, item.table_id, item.device_id))
-
-            elif isinstance(item, CoverStatus):
-                key = f"{item.table_id:02x}:{item.device_id:02x}"
-                if key not in discovered_covers:
-                    discovered_covers.add(key)
-                    new.append(OneControlCoverStateSensor(coordinator, address, item.table_id, item.device_id))
-
-            elif isinstance(item, LevelerStatus):
-                key = f"{item.table_id:02x}:{item.device_id:02x}"
-                if key not in discovered_levelers:
-                    discovered_levelers.add(key)
-                    new.append(OneControlLevelerPositionSensor(coordinator, address, item.table_id, item.device_id))
-
-            elif isinstance(item, TankAlert):
-                key = f"{item.table_id:02x}:{item.device_id:02x}"
-                if key not in discovered_tank_alerts:
-                    discovered_tank_alerts.add(key)
-                    new.append(OneControlTankAlertSensor(coordinator, address, item.table_id, item.device_id))
-
-        if new:
-            async_add_entities(new)
-
-    coordinator.register_event_callback(_on_event)
-
-    # Pre-discover from coordinator state
-    for key, tank in coordinator.tanks.items():
-        if key not in discovered_tanks:
-            discovered_tanks.add(key)
-            entities.append(OneControlTankSensor(coordinator, address, tank.table_id, tank.device_id))
-    for key, gen in coordinator.generators.items():
-        if key not in discovered_generators:
-            discovered_generators.add(key)
-            entities.extend([
-                OneControlGeneratorSensor(coordinator, address, gen.table_id, gen.device_id),
-                OneControlGeneratorBatterySensor(coordinator, address, gen.table_id, gen.device_id),
-                OneControlGeneratorTemperatureSensor(coordinator, address, gen.table_id, gen.device_id),
-            ])
-    for key, hm in coordinator.hour_meters.items():
-        if key not in discovered_hour_meters:
-            discovered_hour_meters.add(key)
-            entities.append(OneControlHourMeterSensor(coordinator, address, hm.table_id, hm.device_id))
-    for key, cov in coordinator.covers.items():
-        if key not in discovered_covers:
-            discovered_covers.add(key)
-            entities.append(OneControlCoverStateSensor(coordinator, address, cov.table_id, cov.device_id))
-    for key, lev in coordinator.levelers.items():
-        if key not in discovered_levelers:
-            discovered_levelers.add(key)
-            entities.append(OneControlLevelerPositionSensor(coordinator, address, lev.table_id, lev.device_id))
-    for key, alert in coordinator.tank_alerts.items():
-        if key not in discovered_tank_alerts:
-            discovered_tank_alerts.add(key)
-            entities.append(OneControlTankAlertSensor(coordinator, address, alert.table_id, alert.device_id))
+        if new := _new_entities(item):
+            if not pending:
+                hass.loop.call_soon(_add_pending)
+            pending.extend(new)
+
+    for event_type, (store, _classes) in specs.items():
+        # Typed callbacks receive list events (e.g. TankLevel) one item at a time
+        entry.async_on_unload(coordinator.register_event_callback(_on_item, event_type))
+        # Pre-discover from coordinator state
+        for item in store.values():
+            entities.extend(_new_entities(item))
     async_add_entities(entities)
 
 
@@ -167,15 +132,47 @@ class _OneControlSensorBase(CoordinatorEntity[OneControlCoordinator], SensorEnti
     def __init__(self, coordinator: OneControlCoordinator, address: str) -> None:
         super().__init__(coordinator)
         self._address = address
-        mac = address.replace(":", "").lower()
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
-        )
+        mac = coordinator.mac_clean
+        self._attr_device_info = coordinator.device_info
         self._mac = mac
+        # Device-derived name, reformatted only when coordinator names change
+        self._cached_name = ""
+        self._cached_name_version = -1
+
+    def _device_name(self, suffix: str) -> str:
+        """Return the device's friendly name plus *suffix*, cached per name version."""
+        version = self.coordinator.device_names_version
+        if version != self._cached_name_version:
+            base = self.coordinator.device_name(self._table_id, self._device_id)
+            self._cached_name = f"{base}{suffix}"
+            self._cached_name_version = version
+        return self._cached_name
+
+    def _subscribe(self, event_type: type, store: dict[str, Any]) -> None:
+        """Follow this device's *event_type* items, seeded from *store*.
+
+        The latest item is kept on the entity so state properties read it
+        directly instead of looking it up in the coordinator on every access.
+        """
+        self._set_current(store.get(self._key))
+        self._unsub = self.coordinator.register_device_callback(
+            event_type, self._table_id, self._device_id, self._on_update
+        )
+
+    def _set_current(self, item: Any) -> None:
+        self._cur = item
+        self._attr_extra_state_attributes = (
+            None if item is None else self._item_attributes(item)
+        )
+
+    def _item_attributes(self, item: Any) -> dict[str, Any] | None:
+        """Extra state attributes for *item*, built once per received item."""
+        return None
+
+    @callback
+    def _on_update(self, item: Any) -> None:
+        self._set_current(item)
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
@@ -362,33 +359,20 @@ class OneControlTankSensor(_OneControlSensorBase):
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
         self._attr_unique_id = f"{self._mac}_tank_{device_id:02x}"
-        self._unsub = coordinator.register_event_callback(self._on_event)
+        self._subscribe(TankLevel, coordinator.tanks)
 
     @property
     def name(self) -> str:
-        base = self.coordinator.device_name(self._table_id, self._device_id)
-        return f"{base} Level"
+        return self._device_name(" Level")
 
     @property
     def native_value(self) -> int | None:
-        tank = self.coordinator.tanks.get(self._key)
+        tank = self._cur
         return tank.level if tank else None
 
     async def async_will_remove_from_hass(self) -> None:
         self._unsub()
 
-    @callback
-    def _on_event(self, event: Any) -> None:
-        items = event if isinstance(event, list) else [event]
-        for item in items:
-            if (
-                isinstance(item, TankLevel)
-                and item.table_id == self._table_id
-                and item.device_id == self._device_id
-            ):
-                self.async_write_ha_state()
-                return
-
 
 # ── Generator / Hour Meter ────────────────────────────────────────────────
 
@@ -410,16 +394,15 @@ class OneControlGeneratorSensor(_OneControlSensorBase):
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
         self._attr_unique_id = f"{self._mac}_generator_{device_id:02x}"
-        self._unsub = coordinator.register_event_callback(self._on_event)
+        self._subscribe(GeneratorStatus, coordinator.generators)
 
     @property
     def name(self) -> str:
-        base = self.coordinator.device_name(self._table_id, self._device_id)
-        return f"{base} Status"
+        return self._device_name(" Status")
 
     @property
     def native_value(self) -> str | None:
-        gen = self.coordinator.generators.get(self._key)
+        gen = self._cur
         if gen is None:
             return None
         return gen.state_name.capitalize()  # Off/Priming/Starting/Running/Stopping
@@ -427,15 +410,6 @@ class OneControlGeneratorSensor(_OneControlSensorBase):
     async def async_will_remove_from_hass(self) -> None:
         self._unsub()
 
-    @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, GeneratorStatus)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
-
 
 class OneControlGeneratorBatterySensor(_OneControlSensorBase):
     """Generator battery voltage sensor — event 0x0A."""
@@ -443,6 +417,7 @@ class OneControlGeneratorBatterySensor(_OneControlSensorBase):
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 2
     _attr_icon = "mdi:car-battery"
 
     def __init__(
@@ -457,32 +432,22 @@ class OneControlGeneratorBatterySensor(_OneControlSensorBase):
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
         self._attr_unique_id = f"{self._mac}_gen_battery_{device_id:02x}"
-        self._unsub = coordinator.register_event_callback(self._on_event)
+        self._subscribe(GeneratorStatus, coordinator.generators)
 
     @property
     def name(self) -> str:
-        base = self.coordinator.device_name(self._table_id, self._device_id)
-        return f"{base} Battery"
+        return self._device_name(" Battery")
 
     @property
     def native_value(self) -> float | None:
-        gen = self.coordinator.generators.get(self._key)
+        gen = self._cur
         if gen is None:
             return None
-        return round(gen.battery_voltage, 2)
+        return gen.battery_voltage
 
     async def async_will_remove_from_hass(self) -> None:
         self._unsub()
 
-    @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, GeneratorStatus)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
-
 
 class OneControlGeneratorTemperatureSensor(_OneControlSensorBase):
     """Generator temperature sensor — event 0x0A.
@@ -494,6 +459,7 @@ class OneControlGeneratorTemperatureSensor(_OneControlSensorBase):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
     _attr_icon = "mdi:thermometer"
 
     def __init__(
@@ -508,32 +474,22 @@ class OneControlGeneratorTemperatureSensor(_OneControlSensorBase):
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
         self._attr_unique_id = f"{self._mac}_gen_temp_{device_id:02x}"
-        self._unsub = coordinator.register_event_callback(self._on_event)
+        self._subscribe(GeneratorStatus, coordinator.generators)
 
     @property
     def name(self) -> str:
-        base = self.coordinator.device_name(self._table_id, self._device_id)
-        return f"{base} Temperature"
+        return self._device_name(" Temperature")
 
     @property
     def native_value(self) -> float | None:
-        gen = self.coordinator.generators.get(self._key)
+        gen = self._cur
         if gen is None or gen.temperature_c is None:
             return None
-        return round(gen.temperature_c, 1)
+        return gen.temperature_c
 
     async def async_will_remove_from_hass(self) -> None:
         self._unsub()
 
-    @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, GeneratorStatus)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
-
 
 class OneControlHourMeterSensor(_OneControlSensorBase):
     """Hour meter sensor — event 0x0F."""
@@ -555,23 +511,18 @@ class OneControlHourMeterSensor(_OneControlSensorBase):
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
         self._attr_unique_id = f"{self._mac}_hourmeter_{device_id:02x}"
-        self._unsub = coordinator.register_event_callback(self._on_event)
+        self._subscribe(HourMeter, coordinator.hour_meters)
 
     @property
     def name(self) -> str:
-        base = self.coordinator.device_name(self._table_id, self._device_id)
-        return f"{base} Hours"
+        return self._device_name(" Hours")
 
     @property
     def native_value(self) -> float | None:
-        hm = self.coordinator.hour_meters.get(self._key)
+        hm = self._cur
         return hm.hours if hm else None
 
-    @property
-    def extra_state_attributes(self) -> dict | None:
-        hm = self.coordinator.hour_meters.get(self._key)
-        if hm is None:
-            return None
+    def _item_attributes(self, hm: HourMeter) -> dict[str, Any]:
         return {
             "maintenance_due": hm.maintenance_due,
             "maintenance_past_due": hm.maintenance_past_due,
@@ -581,15 +532,6 @@ class OneControlHourMeterSensor(_OneControlSensorBase):
     async def async_will_remove_from_hass(self) -> None:
         self._unsub()
 
-    @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, HourMeter)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
-
 
 # ── Cover State Sensors (state-only, no control — INTERNALS.md safety) ───
 
@@ -616,25 +558,20 @@ class OneControlCoverStateSensor(_OneControlSensorBase):
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
         self._attr_unique_id = f"{self._mac}_cover_{device_id:02x}"
-        self._unsub = coordinator.register_event_callback(self._on_event)
+        self._subscribe(CoverStatus, coordinator.covers)
 
     @property
     def name(self) -> str:
-        base = self.coordinator.device_name(self._table_id, self._device_id)
-        return f"{base}"
+        return self._device_name("")
 
     @property
     def native_value(self) -> str | None:
-        cov = self.coordinator.covers.get(self._key)
+        cov = self._cur
         if not cov:
             return None
         return cov.ha_state.capitalize()  # "Opening", "Closing", "Stopped"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        cov = self.coordinator.covers.get(self._key)
-        if not cov:
-            return {}
+    def _item_attributes(self, cov: CoverStatus) -> dict[str, Any]:
         attrs: dict[str, Any] = {
             "raw_status": f"0x{cov.status:02X}",
             "control_disabled": True,
@@ -646,15 +583,6 @@ class OneControlCoverStateSensor(_OneControlSensorBase):
     async def async_will_remove_from_hass(self) -> None:
         self._unsub()
 
-    @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, CoverStatus)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
-
 
 # ── Leveler Sensors ───────────────────────────────────────────────────────
 
@@ -676,26 +604,21 @@ class OneControlLevelerPositionSensor(_OneControlSensorBase):
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
         self._attr_unique_id = f"{self._mac}_leveler_position_{device_id:02x}"
-        self._unsub = coordinator.register_event_callback(self._on_event)
+        self._subscribe(LevelerStatus, coordinator.levelers)
 
     @property
     def name(self) -> str:
-        base = self.coordinator.device_name(self._table_id, self._device_id)
-        return f"{base} Position"
+        return self._device_name(" Position")
 
     @property
     def native_value(self) -> str | None:
-        leveler = self.coordinator.levelers.get(self._key)
+        leveler = self._cur
         if not leveler:
             return None
         positions = {0: "retracted", 1: "extended", 2: "mid", 3: "error"}
         return positions.get(leveler.position_code, f"unknown_{leveler.position_code}")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        leveler = self.coordinator.levelers.get(self._key)
-        if not leveler:
-            return {}
+    def _item_attributes(self, leveler: LevelerStatus) -> dict[str, Any]:
         return {
             "is_active": leveler.is_active,
             "level_achieved": leveler.level_achieved,
@@ -705,15 +628,6 @@ class OneControlLevelerPositionSensor(_OneControlSensorBase):
     async def async_will_remove_from_hass(self) -> None:
         self._unsub()
 
-    @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, LevelerStatus)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
-
 
 # ── Tank Alert Sensors ────────────────────────────────────────────────────
 
@@ -735,27 +649,22 @@ class OneControlTankAlertSensor(_OneControlSensorBase):
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
         self._attr_unique_id = f"{self._mac}_tank_alert_{device_id:02x}"
-        self._unsub = coordinator.register_event_callback(self._on_event)
+        self._subscribe(TankAlert, coordinator.tank_alerts)
 
     @property
     def name(self) -> str:
-        base = self.coordinator.device_name(self._table_id, self._device_id)
-        return f"{base} Alert"
+        return self._device_name(" Alert")
 
     @property
     def native_value(self) -> str | None:
-        alert = self.coordinator.tank_alerts.get(self._key)
+        alert = self._cur
         if not alert:
             return None
         alert_types = {0: "connectivity", 1: "low_level", 2: "high_level"}
         alert_type_str = alert_types.get(alert.alert_type, f"unknown_{alert.alert_type}")
         return "triggered" if alert.is_triggered else f"{alert_type_str}_clear"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        alert = self.coordinator.tank_alerts.get(self._key)
-        if not alert:
-            return {}
+    def _item_attributes(self, alert: TankAlert) -> dict[str, Any]:
         return {
             "alert_type": {0: "connectivity", 1: "low_level", 2: "high_level"}.get(
                 alert.alert_type, f"unknown_{alert.alert_type}"
@@ -765,12 +674,3 @@ class OneControlTankAlertSensor(_OneControlSensorBase):
 
     async def async_will_remove_from_hass(self) -> None:
         self._unsub()
-
-    @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, TankAlert)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
@@ -16,7 +16,6 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -37,37 +36,41 @@ async def async_setup_entry(
     coordinator: OneControlCoordinator = hass.data[DOMAIN][entry.entry_id]
     address = entry.data[CONF_ADDRESS]
 
-    discovered: set[str] = set()
-    discovered_generators: set[str] = set()
+    discovered: set[tuple[int, int]] = set()
+    discovered_generators: set[tuple[int, int]] = set()
 
     @callback
-    def _on_event(event: Any) -> None:
-        if isinstance(event, RelayStatus):
-            key = f"{event.table_id:02x}:{event.device_id:02x}"
-            if key not in discovered:
-                discovered.add(key)
-                async_add_entities(
-                    [OneControlSwitch(coordinator, address, event.table_id, event.device_id)]
-                )
-        elif isinstance(event, GeneratorStatus):
-            key = f"{event.table_id:02x}:{event.device_id:02x}"
-            if key not in discovered_generators:
-                discovered_generators.add(key)
-                async_add_entities(
-                    [OneControlGeneratorSwitch(coordinator, address, event.table_id, event.device_id)]
-                )
-
-    coordinator.register_event_callback(_on_event)
+    def _on_relay(event: RelayStatus) -> None:
+        key = (event.table_id, event.device_id)
+        if key not in discovered:
+            discovered.add(key)
+            async_add_entities(
+                [OneControlSwitch(coordinator, address, event.table_id, event.device_id)]
+            )
+
+    @callback
+    def _on_generator(event: GeneratorStatus) -> None:
+        key = (event.table_id, event.device_id)
+        if key not in discovered_generators:
+            discovered_generators.add(key)
+            async_add_entities(
+                [OneControlGeneratorSwitch(coordinator, address, event.table_id, event.device_id)]
+            )
+
+    entry.async_on_unload(coordinator.register_event_callback(_on_relay, RelayStatus))
+    entry.async_on_unload(coordinator.register_event_callback(_on_generator, GeneratorStatus))
 
     # Also create entities for any relays already discovered
-    for key, relay in coordinator.relays.items():
+    for relay in coordinator.relays.values():
+        key = (relay.table_id, relay.device_id)
         if key not in discovered:
             discovered.add(key)
             async_add_entities(
                 [OneControlSwitch(coordinator, address, relay.table_id, relay.device_id)]
             )
 
-    for key, gen in coordinator.generators.items():
+    for gen in coordinator.generators.values():
+        key = (gen.table_id, gen.device_id)
         if key not in discovered_generators:
             discovered_generators.add(key)
             async_add_entities(
@@ -91,18 +94,14 @@ class OneControlSwitch(CoordinatorEntity[OneControlCoordinator], SwitchEntity):
         self._table_id = table_id
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_switch_{device_id:02x}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
-        )
+        self._attr_device_info = coordinator.device_info
         self._optimistic_is_on: bool | None = None
         self._optimistic_until: float = 0.0
-        self._unsub = coordinator.register_event_callback(self._on_event)
+        self._unsub = coordinator.register_device_callback(
+            RelayStatus, table_id, device_id, self._on_event
+        )
 
     @property
     def name(self) -> str:
@@ -171,31 +170,26 @@ class OneControlSwitch(CoordinatorEntity[OneControlCoordinator], SwitchEntity):
         self._unsub()
 
     @callback
-    def _on_event(self, event: Any) -> None:
+    def _on_event(self, relay: RelayStatus) -> None:
         if (
-            isinstance(event, RelayStatus)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
+            self._optimistic_is_on is not None
+            and time.monotonic() < self._optimistic_until
+            and relay.is_on != self._optimistic_is_on
         ):
-            if (
-                self._optimistic_is_on is not None
-                and time.monotonic() < self._optimistic_until
-                and event.is_on != self._optimistic_is_on
-            ):
-                _LOGGER.debug(
-                    "Ignoring contradictory relay echo during guard window "
-                    "for %s (event=%s optimistic=%s)",
-                    self._key,
-                    event.is_on,
-                    self._optimistic_is_on,
-                )
-                return
-
-            if self._optimistic_is_on is not None and event.is_on == self._optimistic_is_on:
-                self._optimistic_until = 0.0
-                self._optimistic_is_on = None
+            _LOGGER.debug(
+                "Ignoring contradictory relay echo during guard window "
+                "for %s (event=%s optimistic=%s)",
+                self._key,
+                relay.is_on,
+                self._optimistic_is_on,
+            )
+            return
 
-            self.async_write_ha_state()
+        if self._optimistic_is_on is not None and relay.is_on == self._optimistic_is_on:
+            self._optimistic_until = 0.0
+            self._optimistic_is_on = None
+
+        self.async_write_ha_state()
 
 
 class OneControlGeneratorSwitch(CoordinatorEntity[OneControlCoordinator], SwitchEntity):
@@ -223,16 +217,12 @@ class OneControlGeneratorSwitch(CoordinatorEntity[OneControlCoordinator], Switch
         self._table_id = table_id
         self._device_id = device_id
         self._key = f"{table_id:02x}:{device_id:02x}"
-        mac = address.replace(":", "").lower()
+        mac = coordinator.mac_clean
         self._attr_unique_id = f"{mac}_gen_switch_{device_id:02x}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"OneControl {address}",
-            manufacturer="Lippert / LCI",
-            model="BLE Gateway",
-            connections={("bluetooth", address)},
+        self._attr_device_info = coordinator.device_info
+        self._unsub = coordinator.register_device_callback(
+            GeneratorStatus, table_id, device_id, self._on_event
         )
-        self._unsub = coordinator.register_event_callback(self._on_event)
 
     @property
     def name(self) -> str:
@@ -259,10 +249,5 @@ class OneControlGeneratorSwitch(CoordinatorEntity[OneControlCoordinator], Switch
         self._unsub()
 
     @callback
-    def _on_event(self, event: Any) -> None:
-        if (
-            isinstance(event, GeneratorStatus)
-            and event.table_id == self._table_id
-            and event.device_id == self._device_id
-        ):
-            self.async_write_ha_state()
+    def _on_event(self, _event: Any) -> None:
+        self.async_write_ha_state()
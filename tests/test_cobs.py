@@ -94,6 +94,33 @@ class TestCobsByteDecoder:
         # Should be None since CRC was corrupted
         assert result is None
 
+    def test_overlong_frame_dropped(self):
+        """A frame longer than the buffer is dropped, and the next one still decodes."""
+        dec = CobsByteDecoder(use_crc=False)
+        stream = cobs_encode(bytes(range(1, 201)) * 2, use_crc=False)
+        stream += cobs_encode(b"\x01\x02", use_crc=False)
+        frames = [f for b in stream if (f := dec.decode_byte(b)) is not None]
+        assert frames == [b"\x01\x02"]
+
+    def test_feed_matches_decode_byte(self):
+        """feed() over split notifications yields the same frames as decode_byte()."""
+        payloads = [b"\x01\x02", bytes(70), bytes(range(1, 130)), b"\x00\x05\x00\x00"]
+        stream = b"".join(cobs_encode(p, prepend_start=True, use_crc=True) for p in payloads)
+
+        expected = []
+        dec = CobsByteDecoder(use_crc=True)
+        for b in stream:
+            frame = dec.decode_byte(b)
+            if frame is not None:
+                expected.append(frame)
+
+        dec = CobsByteDecoder(use_crc=True)
+        frames = []
+        for i in range(0, len(stream), 20):  # BLE-notification-sized chunks
+            frames.extend(dec.feed(stream[i : i + 20]))
+
+        assert frames == expected == payloads
+
 
 class TestCobsEncode:
     """COBS encoder."""
@@ -115,3 +142,9 @@ class TestCobsEncode:
         encoded = cobs_encode(b"", prepend_start=True)
         # Should be just [0x00, 0x00] (start + end)
         assert encoded == b"\x00\x00"
+
+    def test_long_runs_roundtrip(self):
+        """Blocks longer than 63 bytes and zero runs longer than 3 survive a roundtrip."""
+        original = bytes(range(1, 100)) + b"\x00" * 5 + b"\x2a" + b"\x00" * 2
+        dec = CobsByteDecoder(use_crc=True)
+        assert dec.feed(cobs_encode(original)) == [original]
@@ -46,6 +46,14 @@ class TestTeaEncrypt:
         result = tea_encrypt(STEP1_CIPHER, 0)
         assert result != 0
 
+    def test_known_vectors(self):
+        """Pin outputs so cipher-loop refactors can't silently change keys."""
+        assert tea_encrypt(STEP1_CIPHER, 0x12345678) == 0xA099E12F
+        assert tea_encrypt(STEP2_CIPHER, 0xDEADBEEF) == 0x7A23C5FA
+        assert tea_encrypt(0, 0) == 0xF5D67651
+        assert tea_decrypt(STEP1_CIPHER, 0x12345678) == 0xFAC969E8
+        assert tea_decrypt(0xFFFFFFFF, 0xFFFFFFFF) == 0x0D6BEF7A
+
     def test_encrypt_stays_32bit(self):
         """Result should always fit in 32 bits."""
         result = tea_encrypt(0xFFFFFFFF, 0xFFFFFFFF)
@@ -123,3 +131,10 @@ class TestStep2Key:
         assert k1[:4] == k2[:4]
         # PIN portions differ
         assert k1[4:10] != k2[4:10]
+
+    def test_accepts_any_buffer(self):
+        """Notification payloads (bytearray / memoryview) work without a bytes() copy."""
+        seed = b"\x01\x02\x03\x04"
+        expected = calculate_step2_key(seed, "000000")
+        assert calculate_step2_key(bytearray(seed), "000000") == expected
+        assert calculate_step2_key(memoryview(seed), "000000") == expected